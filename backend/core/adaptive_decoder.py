@@ -0,0 +1,154 @@
+"""
+Adaptive Whisper Decoding
+Greedy decoding first, beam search only where Whisper is unsure.
+
+Beam search (beam_size=5) is several times slower than greedy on CPU, but most
+segments of a clear answer come out the same either way. AdaptiveDecoder
+decodes the clip greedily and re-decodes ONLY the segments that look unreliable:
+
+    avg_logprob       < STT_LOGPROB_THRESHOLD          (low confidence)
+    compression_ratio > STT_COMPRESSION_RATIO_THRESHOLD  (repetitive / hallucinated text)
+
+The beam result replaces the greedy one when it is more confident. Fallbacks
+are logged per segment and totals are kept in `stats`, so the thresholds can
+be tuned against how much beam time they cost.
+
+STT_DECODING=beam restores the old always-beam behaviour, STT_DECODING=greedy
+never falls back.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# ==================== CONFIG ====================
+STT_DECODING = os.getenv("STT_DECODING", "adaptive")  # adaptive | beam | greedy
+STT_BEAM_SIZE = int(os.getenv("STT_BEAM_SIZE", "5"))
+STT_LOGPROB_THRESHOLD = float(os.getenv("STT_LOGPROB_THRESHOLD", "-1.0"))
+STT_COMPRESSION_RATIO_THRESHOLD = float(os.getenv("STT_COMPRESSION_RATIO_THRESHOLD", "2.4"))
+SEGMENT_PADDING_S = 0.2  # Context around a segment when it is re-decoded
+
+
+class AdaptiveDecoder:
+    """Wraps a faster-whisper WhisperModel: greedy pass + per-segment beam fallback"""
+
+    def __init__(
+        self,
+        model,
+        sample_rate: int = 16000,
+        language: str = "en",
+        mode: str = STT_DECODING,
+        beam_size: int = STT_BEAM_SIZE,
+        logprob_threshold: float = STT_LOGPROB_THRESHOLD,
+        compression_ratio_threshold: float = STT_COMPRESSION_RATIO_THRESHOLD,
+    ):
+        if mode not in ("adaptive", "beam", "greedy"):
+            raise ValueError(f"Unknown decoding mode '{mode}' (adaptive, beam or greedy)")
+        self.model = model
+        self.sample_rate = sample_rate
+        self.language = language
+        self.mode = mode
+        self.beam_size = beam_size
+        self.logprob_threshold = logprob_threshold
+        self.compression_ratio_threshold = compression_ratio_threshold
+
+        # Totals over all clips (decoded from several threads)
+        self.stats: Dict[str, float] = {
+            "clips": 0, "segments": 0, "fallbacks": 0, "beam_wins": 0,
+            "first_pass_s": 0.0, "fallback_s": 0.0,
+        }
+        self._stats_lock = threading.Lock()
+
+    def is_unsure(self, avg_logprob: float, compression_ratio: float) -> bool:
+        return avg_logprob < self.logprob_threshold or compression_ratio > self.compression_ratio_threshold
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+        on_segment: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """
+        Transcribe one clip. on_segment(text) gets each final segment as soon as
+        it is decided (after its fallback, if any).
+        """
+        if self.mode == "beam":
+            # Previous behaviour: beam search with Whisper's own temperature fallback
+            first_pass = {"beam_size": self.beam_size}
+        else:
+            # Whisper's temperature fallback would hide the unsure segments from us
+            first_pass = {"beam_size": 1, "temperature": 0.0}
+        start = time.time()
+        fallback_s = 0.0
+        fallbacks = beam_wins = 0
+
+        segments, info = self.model.transcribe(
+            audio, language=self.language, initial_prompt=initial_prompt, **first_pass
+        )
+        texts: List[str] = []
+        for segment in segments:
+            text = segment.text
+            if self.mode == "adaptive" and self.is_unsure(segment.avg_logprob, segment.compression_ratio):
+                fallbacks += 1
+                fallback_start = time.time()
+                beam = self._redecode(audio, segment, initial_prompt)
+                elapsed = time.time() - fallback_start
+                fallback_s += elapsed
+
+                # Beam wins if it is confident and not repetitive, or at least more confident
+                won = beam is not None and (not self.is_unsure(beam[1], beam[2]) or beam[1] > segment.avg_logprob)
+                if won:
+                    beam_wins += 1
+                    text = beam[0]
+                print(f"   [STT] Beam fallback {segment.start:.1f}-{segment.end:.1f}s "
+                      f"(logprob {segment.avg_logprob:.2f}, compression {segment.compression_ratio:.2f}) "
+                      f"{elapsed:.2f}s -> {'beam' if won else 'kept greedy'}")
+
+            texts.append(text)
+            if on_segment is not None:
+                on_segment(text)
+
+        total_s = time.time() - start
+        with self._stats_lock:
+            self.stats["clips"] += 1
+            self.stats["segments"] += len(texts)
+            self.stats["fallbacks"] += fallbacks
+            self.stats["beam_wins"] += beam_wins
+            self.stats["first_pass_s"] += total_s - fallback_s
+            self.stats["fallback_s"] += fallback_s
+        if fallbacks:
+            print(f"   [STT] {len(texts)} segments, {fallbacks} re-decoded with beam "
+                  f"({total_s - fallback_s:.2f}s first pass + {fallback_s:.2f}s fallback)")
+        return " ".join(texts).strip()
+
+    def _redecode(self, audio: np.ndarray, segment, initial_prompt: Optional[str]):
+        """(text, avg_logprob, compression_ratio) of one segment decoded with beam search, or None"""
+        start = max(0, int((segment.start - SEGMENT_PADDING_S) * self.sample_rate))
+        end = min(len(audio), int((segment.end + SEGMENT_PADDING_S) * self.sample_rate))
+        if end <= start:
+            return None
+
+        segments, info = self.model.transcribe(
+            audio[start:end], beam_size=self.beam_size, language=self.language,
+            initial_prompt=initial_prompt, temperature=0.0
+        )
+        segments = list(segments)
+        if not segments:
+            return None
+        text = "".join(s.text for s in segments)
+        # Duration-weighted confidence of the re-decoded span
+        weights = [max(s.end - s.start, 1e-3) for s in segments]
+        avg_logprob = sum(s.avg_logprob * w for s, w in zip(segments, weights)) / sum(weights)
+        return text, avg_logprob, max(s.compression_ratio for s in segments)
+
+    def summary(self) -> Dict[str, float]:
+        """Totals plus fallback rate and time share, for tuning the thresholds"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        total = stats["first_pass_s"] + stats["fallback_s"]
+        stats["fallback_rate"] = round(stats["fallbacks"] / stats["segments"], 3) if stats["segments"] else 0.0
+        stats["fallback_time_share"] = round(stats["fallback_s"] / total, 3) if total else 0.0
+        return stats
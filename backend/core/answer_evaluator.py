@@ -1,14 +1,77 @@
-import torch
-from sentence_transformers import SentenceTransformer, util
+import os
+import sys
+import numpy as np
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.question_store import QuestionStore
+from ml.embeddings import EmbeddingIndex, get_embedding_engine
+from utils.stage_timing import stage
+
+# Score (0-100) from which an answer counts as correct (lenient semantic match)
+CORRECT_THRESHOLD = 60
+
+
+def load_answer_index(engine, question_repo=None) -> EmbeddingIndex:
+    """
+    Expected-answer index of the question bank (defaults to QUESTION_REPO).
+    A QuestionStore bank is indexed by store row and loaded by its fingerprint,
+    without decoding any answer text.
+    """
+    if question_repo is None:
+        from core.question_bank import QUESTION_REPO
+        question_repo = QUESTION_REPO
+
+    index = EmbeddingIndex("expected_answers")
+    if isinstance(question_repo, QuestionStore):
+        return index.build_or_load(
+            engine, lambda: [ans for _, ans in question_repo.iter_rows()],
+            source_fingerprint=question_repo.fingerprint
+        )
+    return index.build_or_load(engine, [ans for questions in question_repo.values() for _, ans in questions])
+
 
 class AnswerEvaluator:
-    def __init__(self):
+    def __init__(self, use_answer_index=True):
         print("[JUDGE] Initializing Evaluation Engine (SentenceTransformer)...")
-        # Reuse the same model as the intent classifier data loader for efficiency if possible,
-        # otherwise load explicitly.
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Shared with IntentPredictor: the process-wide engine loads the model only once.
+        self.engine = get_embedding_engine()
+        self.model = self.engine.model
+
+        # Pre-encoded expected answers from the static question bank.
+        # Scoring a bank question then only needs to encode the candidate's answer.
+        self.answer_index = self._load_answer_index() if use_answer_index else None
         print("✅ Judge Ready")
 
+    def _load_answer_index(self):
+        try:
+            return load_answer_index(self.engine)
+        except Exception as e:
+            print(f"   [JUDGE] Expected-answer index unavailable: {e}")
+            return None
+
+    def _embed(self, texts):
+        """
+        Normalized embeddings for distinct texts: index hits are read from the
+        memory-mapped index, everything else is encoded in ONE call.
+        Returns: dict text -> vector
+        """
+        vectors = {}
+        to_encode = []
+        with stage("evaluator", "index_lookup"):
+            for text in dict.fromkeys(texts):
+                vector = self.answer_index.lookup(text) if self.answer_index is not None else None
+                if vector is None:
+                    to_encode.append(text)
+                else:
+                    vectors[text] = vector
+
+        if to_encode:
+            for text, vector in zip(to_encode, self.engine.encode(to_encode, normalize=True)):
+                vectors[text] = vector
+        return vectors
+
     def evaluate(self, user_answer, expected_answer):
         """
         Compares user answer with expected answer using Cosine Similarity.
@@ -17,14 +80,144 @@ class AnswerEvaluator:
         if not user_answer or len(user_answer.strip()) < 2:
             return 0, False
 
-        embeddings = self.model.encode([user_answer, expected_answer], convert_to_tensor=True)
-        # Cosine similarity
-        similarity = util.cos_sim(embeddings[0], embeddings[1]).item()
+        vectors = self._embed([user_answer, expected_answer])
+        # Cosine similarity (embeddings are normalized)
+        with stage("evaluator", "similarity"):
+            similarity = float(np.dot(vectors[user_answer], vectors[expected_answer]))
         
+        return self._to_score(similarity)
+
+    def evaluate_batch(self, pairs):
+        """
+        Scores many (user_answer, expected_answer) pairs with ONE encode call.
+        Returns: list of (score_percentage, is_correct_bool) in input order
+        """
+        results = [(0, False)] * len(pairs)
+
+        # Same short-answer guard as evaluate()
+        scored = [
+            i for i, (user_answer, _) in enumerate(pairs)
+            if user_answer and len(user_answer.strip()) >= 2
+        ]
+        if not scored:
+            return results
+
+        # Each distinct text is embedded once (expected answers often repeat)
+        vectors = self._embed([text for i in scored for text in pairs[i]])
+        with stage("evaluator", "similarity"):
+            user_matrix = np.stack([vectors[pairs[i][0]] for i in scored])
+            expected_matrix = np.stack([vectors[pairs[i][1]] for i in scored])
+
+            # Row-wise cosine similarity: user answer i vs expected answer i
+            similarities = np.einsum("ij,ij->i", user_matrix, expected_matrix)
+
+        for i, similarity in zip(scored, similarities.tolist()):
+            results[i] = self._to_score(similarity)
+        return results
+
+    def encode_references(self, references):
+        """
+        Normalized embeddings of reference answers, shape [N, dim].
+        Bank answers come from the index; encode once, score many times.
+        """
+        vectors = self._embed(references)
+        return np.stack([vectors[ref] for ref in references])
+
+    def score_against(self, user_answer, reference_matrix):
+        """
+        Scores an answer against pre-encoded references (best match wins).
+        Returns: (score_percentage, is_correct_bool)
+        """
+        if not user_answer or len(user_answer.strip()) < 2:
+            return 0, False
+
+        vector = self._embed([user_answer])[user_answer]
+        with stage("evaluator", "similarity"):
+            similarity = float((reference_matrix @ vector).max())
+        return self._to_score(similarity)
+
+    def evaluate_multi(self, user_answer, references):
+        """
+        Scores one answer against several reference answers with ONE encode
+        call and one matrix-vector product.
+        Returns: dict with the best score ("score", "is_correct", "best_reference"),
+                 "max" / "mean" scores and a per-reference "breakdown"
+        """
+        references = [ref for ref in dict.fromkeys(references or []) if ref and ref.strip()]
+        result = {
+            "score": 0,
+            "is_correct": False,
+            "max": 0,
+            "mean": 0.0,
+            "best_reference": None,
+            "breakdown": [{"reference": ref, "score": 0, "similarity": 0.0} for ref in references],
+        }
+        if not references or not user_answer or len(user_answer.strip()) < 2:
+            return result
+
+        vectors = self._embed([user_answer] + references)
+        with stage("evaluator", "similarity"):
+            reference_matrix = np.stack([vectors[ref] for ref in references])
+            # Cosine similarity of the answer with every reference at once
+            similarities = reference_matrix @ vectors[user_answer]
+
+        scores = []
+        for entry, similarity in zip(result["breakdown"], similarities.tolist()):
+            entry["score"], _ = self._to_score(similarity)
+            entry["similarity"] = round(similarity, 4)
+            scores.append(entry["score"])
+
+        best = int(np.argmax(scores))
+        result["score"], result["is_correct"] = self._to_score(float(similarities[best]))
+        result["max"] = scores[best]
+        result["mean"] = round(sum(scores) / len(scores), 2)
+        result["best_reference"] = best
+        return result
+
+    def rescore_report_card(self, report_card, threshold=CORRECT_THRESHOLD):
+        """
+        Re-scores a whole interview report card in bulk: user answers and
+        references are embedded in two batched calls, and all similarities come
+        from one row-wise product (multi-reference entries keep their best match).
+        Entries: {"user_ans", "expected"[, "references"]}
+        Returns: list of (score_percentage, is_correct_bool) in report-card order
+        """
+        results = [(0, False)] * len(report_card)
+
+        # (entry index, reference) rows; short answers score 0 like evaluate()
+        rows = []
+        for i, entry in enumerate(report_card):
+            user_answer = entry.get("user_ans") or ""
+            if len(user_answer.strip()) < 2:
+                continue
+            references = entry.get("references") or [entry.get("expected")]
+            rows.extend((i, ref) for ref in dict.fromkeys(references) if ref and ref.strip())
+        if not rows:
+            return results
+
+        user_vectors = self._embed([report_card[i]["user_ans"] for i, _ in rows])
+        reference_vectors = self._embed([ref for _, ref in rows])
+
+        with stage("evaluator", "similarity"):
+            user_matrix = np.stack([user_vectors[report_card[i]["user_ans"]] for i, _ in rows])
+            reference_matrix = np.stack([reference_vectors[ref] for _, ref in rows])
+            similarities = np.einsum("ij,ij->i", user_matrix, reference_matrix)
+
+            # Best reference per entry (rows are grouped by entry)
+            entries = np.array([i for i, _ in rows])
+            starts = np.flatnonzero(np.r_[True, entries[1:] != entries[:-1]])
+            best = np.maximum.reduceat(similarities, starts)
+
+        for i, similarity in zip(entries[starts].tolist(), best.tolist()):
+            results[i] = self._to_score(similarity, threshold)
+        return results
+
+    def _to_score(self, similarity, threshold=CORRECT_THRESHOLD):
+        """Maps a cosine similarity to (score_percentage, is_correct_bool)"""
         # Scale to 0-100
         score = max(0, min(100, int(similarity * 100)))
         
         # Thresholds
-        is_correct = score >= 60  # Lenient threshold for semantic match
+        is_correct = score >= threshold  # Lenient threshold for semantic match
         
         return score, is_correct
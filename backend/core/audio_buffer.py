@@ -0,0 +1,154 @@
+"""
+Audio Ring Buffer
+Preallocated float32 buffer that the microphone callback writes into directly.
+
+One buffer per controller, allocated once for MAX_ANSWER_SECONDS of audio and
+written continuously across answers (positions are absolute sample counts, so
+answer N can still be read while answer N+1 is being recorded). Each consumer
+reads through its own RingReader cursor and gets zero-copy views into the
+buffer - a sample is copied exactly once, from the PortAudio block into the
+ring.
+
+    ring = AudioRingBuffer(MAX_ANSWER_SECONDS * SAMPLE_RATE)
+    reader = ring.reader()                        # starts at the current write position
+    callback = lambda indata, *_: ring.write(indata[:, 0])
+    ...
+    block = reader.read(timeout=0.05)             # view, valid until the writer laps it
+    reader.close()                                # end of answer
+
+Views stay valid until the writer wraps around to them, i.e. for `capacity`
+samples of further recording. A reader that falls further behind than that
+skips the overwritten samples and counts them in `lost_samples` (and the
+buffer's `overflow_samples`).
+"""
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Single-writer ring of float32 mono samples with absolute positions"""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity, dtype=np.float32)
+        self.written = 0           # total samples ever written (absolute write position)
+        self.overflow_samples = 0  # samples overwritten before a reader got to them
+        self._cond = threading.Condition()
+
+    @property
+    def oldest(self) -> int:
+        """Absolute position of the oldest sample still in the buffer"""
+        return max(0, self.written - self.capacity)
+
+    def write(self, samples: np.ndarray) -> int:
+        """Audio callback entry point: copy `samples` into the ring (never blocks on readers)"""
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        n = len(samples)
+        if n > self.capacity:
+            samples = samples[-self.capacity:]
+        start = (self.written + n - len(samples)) % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self.data[start:start + first] = samples[:first]
+        if first < len(samples):
+            self.data[:len(samples) - first] = samples[first:]
+
+        with self._cond:
+            self.written += n
+            self._cond.notify_all()
+        return n
+
+    def wait(self, position: int, timeout: Optional[float] = None) -> bool:
+        """Block until more than `position` samples were written (or timeout)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.written > position, timeout)
+
+    def view(self, start: int, stop: int) -> np.ndarray:
+        """
+        Samples [start, stop) as a zero-copy view, up to the wrap point
+        (the caller continues from start + len(view)).
+        """
+        offset = start % self.capacity
+        length = min(stop - start, self.capacity - offset)
+        return self.data[offset:offset + max(0, length)]
+
+    def snapshot(self, start: int, stop: Optional[int] = None) -> np.ndarray:
+        """Samples [start, stop) in one array: a view unless the span wraps (then one copy)"""
+        stop = self.written if stop is None else min(stop, self.written)
+        if start < self.oldest:
+            self.overflow_samples += self.oldest - start
+            start = self.oldest
+        head = self.view(start, stop)
+        if len(head) == stop - start:
+            return head
+        return np.concatenate((head, self.view(start + len(head), stop)))
+
+    def reader(self, start: Optional[int] = None) -> "RingReader":
+        """Cursor starting at `start` (default: the current write position)"""
+        return RingReader(self, self.written if start is None else start)
+
+    def stats(self, sample_rate: int) -> dict:
+        return {
+            "capacity_s": round(self.capacity / sample_rate, 1),
+            "recorded_s": round(self.written / sample_rate, 1),
+            "overflow_s": round(self.overflow_samples / sample_rate, 2),
+            "memory_mb": round(self.data.nbytes / 1024 ** 2, 1),
+        }
+
+
+class RingReader:
+    """One consumer's cursor over an AudioRingBuffer span [start, stop)"""
+
+    def __init__(self, ring: AudioRingBuffer, start: int):
+        self.ring = ring
+        self.start = start
+        self.position = start
+        self.stop: Optional[int] = None  # set by close(): end of this answer
+        self.lost_samples = 0
+
+    def __len__(self) -> int:
+        """Samples in this reader's span so far"""
+        return (self.ring.written if self.stop is None else self.stop) - self.start
+
+    @property
+    def exhausted(self) -> bool:
+        return self.stop is not None and self.position >= self.stop
+
+    def close(self):
+        """Mark the end of the span at the current write position"""
+        if self.stop is None:
+            self.stop = self.ring.written
+
+    def read(self, timeout: Optional[float] = None) -> np.ndarray:
+        """
+        Next unread samples as a zero-copy view (empty if none arrived within
+        `timeout` or the span is exhausted).
+        """
+        end = self.ring.written if self.stop is None else self.stop
+        if self.position >= end:
+            if self.stop is not None or not self.ring.wait(self.position, timeout):
+                return self.ring.data[:0]
+            end = self.ring.written if self.stop is None else self.stop
+
+        oldest = self.ring.oldest
+        if self.position < oldest:
+            lost = oldest - self.position
+            self.lost_samples += lost
+            self.ring.overflow_samples += lost
+            self.position = oldest
+
+        block = self.ring.view(self.position, end)
+        self.position += len(block)
+        return block
+
+    def snapshot(self) -> np.ndarray:
+        """Whole span so far as one array (view unless it wraps)"""
+        stop = self.ring.written if self.stop is None else self.stop
+        lost_before = self.ring.overflow_samples
+        audio = self.ring.snapshot(self.start, stop)
+        self.lost_samples += self.ring.overflow_samples - lost_before
+        return audio
@@ -0,0 +1,112 @@
+"""
+Incremental Answer Scorer
+Scores a candidate's answer while it is still being transcribed.
+
+The reference answer(s) are embedded ONCE up front (bank answers come straight
+from the expected-answer index). Every transcript chunk extends the running
+transcript, which is re-scored with one encode + one matrix-vector product.
+When the transcript is complete the final score is already known.
+
+    scorer = IncrementalAnswerScorer(judge, expected_answer)
+    text = transcribe(audio, on_segment=scorer.add_chunk)
+    score, is_correct = scorer.final(text)   # no extra encode
+"""
+
+import threading
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+# ==================== CONFIG ====================
+# Running score at which the answer counts as "covered" (early transition hint)
+COVERED_SCORE = 75
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+class IncrementalAnswerScorer:
+    """
+    Running semantic score of a partial transcript against cached reference embeddings.
+    Thread-safe: chunks may arrive from a transcription thread while another reads the score.
+    """
+
+    def __init__(
+        self,
+        evaluator,
+        references: Union[str, Sequence[str]],
+        covered_score: int = COVERED_SCORE,
+        on_covered: Optional[Callable[[int], None]] = None,
+    ):
+        """
+        Args:
+            evaluator: AnswerEvaluator (shared embedding engine + expected-answer index)
+            references: Expected answer, or several references (best match wins)
+            covered_score: Running score that marks the answer as covered
+            on_covered: Called once with the score when `covered_score` is first reached
+        """
+        if isinstance(references, str):
+            references = [references]
+        self.evaluator = evaluator
+        self.references: List[str] = [ref for ref in dict.fromkeys(references) if ref and ref.strip()]
+        self.reference_matrix = evaluator.encode_references(self.references) if self.references else None
+        self.covered_score = covered_score
+        self.on_covered = on_covered
+
+        self.chunks: List[str] = []
+        self.transcript = ""
+        self.score = 0
+        self.is_correct = False
+        self.best_score = 0
+        self.updates = 0
+
+        self._scored_transcript: Optional[str] = None
+        self._covered_notified = False
+        self._lock = threading.Lock()
+
+    @property
+    def covered(self) -> bool:
+        """True once the running score has reached `covered_score`"""
+        return self.best_score >= self.covered_score
+
+    def add_chunk(self, text: str) -> int:
+        """Append a partial transcript chunk and return the updated running score"""
+        text = _normalize(text or "")
+        if not text:
+            return self.score
+
+        with self._lock:
+            self.chunks.append(text)
+            self.transcript = " ".join(self.chunks)
+            self._rescore()
+            score = self.score
+            notify = self.covered and not self._covered_notified
+            if notify:
+                self._covered_notified = True
+
+        if notify and self.on_covered is not None:
+            self.on_covered(score)
+        return score
+
+    def final(self, transcript: Optional[str] = None) -> Tuple[int, bool]:
+        """
+        Final (score, is_correct). Free when `transcript` matches the chunks already
+        scored; otherwise the given transcript replaces them and is scored once.
+        """
+        with self._lock:
+            if transcript is not None:
+                transcript = _normalize(transcript)
+                if transcript != self.transcript:
+                    self.chunks = [transcript] if transcript else []
+                    self.transcript = transcript
+            if self._scored_transcript != self.transcript:
+                self._rescore()
+            return self.score, self.is_correct
+
+    def _rescore(self):
+        if self.reference_matrix is None:
+            self.score, self.is_correct = 0, False
+        else:
+            self.score, self.is_correct = self.evaluator.score_against(self.transcript, self.reference_matrix)
+        self._scored_transcript = self.transcript
+        self.best_score = max(self.best_score, self.score)
+        self.updates += 1
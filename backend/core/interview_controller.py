@@ -61,8 +61,14 @@ from typing import Optional, Dict, Any, List
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ml.training.intent_predictor import IntentPredictor
-from core.question_bank import get_all_questions
+from core.question_bank import get_all_questions, QuestionSampler
 from core.answer_evaluator import AnswerEvaluator
+from core.incremental_scorer import IncrementalAnswerScorer
+from core.semantic_question_index import SemanticQuestionIndex
+from core.streaming_transcriber import StreamingTranscriber
+from core.adaptive_decoder import AdaptiveDecoder
+from core.audio_buffer import AudioRingBuffer
+from core.speculative_planner import SpeculativePlanner
 
 # Resume Module Imports (Phase 2.75)
 try:
@@ -79,7 +85,12 @@ except ImportError as e:
 # ================= CONFIG =================
 WHISPER_MODEL_SIZE = "medium"  # Now using faster-whisper INT8 (fits in 4GB VRAM)
 SAMPLE_RATE = 16000
+STREAMING_STT = True  # Transcribe VAD-cut utterances while the candidate is still speaking
+MAX_ANSWER_SECONDS = int(os.getenv("MAX_ANSWER_SECONDS", "300"))  # Audio ring buffer capacity
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "2"))  # Answers decoded in parallel
+SCORE_BATCH_SIZE = 8  # Transcribed answers judged per (batched) call
 QUESTIONS_PER_TOPIC = 5
+QUESTION_PAUSE_S = 2  # Pause before a question, counted from the end of the previous turn
 RESUME_QUESTIONS_TARGET = 20  # Target 18-22 resume-based questions (covering all sections)
 
 class InterviewState(Enum):
@@ -114,26 +125,49 @@ class InterviewController:
         
         try:
             # Using faster-whisper with INT8 compute type to save ~50% VRAM
-            self.stt_model = WhisperModel(WHISPER_MODEL_SIZE, device=device, compute_type="int8")
+            # num_workers: one decoder per transcription thread; on CPU they split the cores
+            self.stt_model = WhisperModel(
+                WHISPER_MODEL_SIZE, device=device, compute_type="int8",
+                num_workers=TRANSCRIBE_WORKERS,
+                cpu_threads=max(1, (os.cpu_count() or 1) // TRANSCRIBE_WORKERS) if device == "cpu" else 0
+            )
             print(f"✅ faster-whisper '{WHISPER_MODEL_SIZE}' Ready on {device.upper()}")
+            # Greedy first, beam search only for unsure segments (STT_DECODING)
+            self.decoder = AdaptiveDecoder(self.stt_model, sample_rate=SAMPLE_RATE, language="en")
         except Exception as e:
             print(f"❌ Error loading faster-whisper: {e}")
             raise e
 
 
         
+        # Microphone ring buffer: allocated once, reused by every answer
+        self.audio_buffer = AudioRingBuffer(MAX_ANSWER_SECONDS * SAMPLE_RATE)
+        
         # 3. Brains
         self.router = IntentPredictor()
         self.judge = AnswerEvaluator()
+        try:
+            # Follow-ups by meaning of the answer (shares the judge's embedding model)
+            self.question_index = SemanticQuestionIndex(self.judge.engine)
+        except Exception as e:
+            print(f"   [Warning] Semantic question index unavailable, keyword follow-ups only: {e}")
+            self.question_index = None
         
         # Async Infrastructure
-        self.processing_queue = queue.Queue() # Stores (audio, question, expected_ans, topic)
+        self.processing_queue = queue.Queue() # Stores (seq, audio, question, expected_ans, topic)
+        self.scoring_queue = queue.Queue()    # Stores (seq, text, is_command, question, expected_ans, topic)
+        self.transcribe_workers = TRANSCRIBE_WORKERS
+        self.next_answer_seq = 0
         self.active_tasks = 0
         self.lock = threading.Lock()
+        self.answer_scorer = None  # Scores the answer being recorded, segment by segment
         
         # Context State for Adaptiveness (Counter-Questioning)
         self.context_keywords = queue.Queue() # Keywords found in previous answer
+        self.context_answers = queue.Queue() # (seq, transcript) of previous answers (semantic follow-ups)
+        self.last_context_seq = -1 # Answers up to this seq were already followed up
         self.used_keywords = set() # To prevent repeating same topic
+        self.planner = None # Plans the next question while the candidate answers
         self.stop_signal = False
         self.skip_signal = False
         self.stop_phrases = ["stop interview", "terminate", "end session", "abort"]
@@ -146,12 +180,14 @@ class InterviewController:
         self.current_topic = ""
         self.questions_asked_count = 0
         self.asked_q_hashes = set()
+        self.question_sampler = QuestionSampler() # Per-session random order per topic
         self.report_card = []
         self.is_running = False
         self.report_generated = False # Flag for idempotency
         self.checkout_asked = False   # Flag for final question
         # Guard to prevent state transitions while user is still answering.
         self.awaiting_user_answer = False
+        self.turn_ended_at = 0.0  # End of the last answer / bot line (paces the next question)
         
         # ===== PHASE 2.75: RESUME INTEGRATION =====
         # Resolve resume path to absolute path
@@ -182,8 +218,8 @@ class InterviewController:
             self._init_resume_module()
         
         # Start Background Workers
-        self.executor = ThreadPoolExecutor(max_workers=2)  # +1 for resume processing
-        self.executor.submit(self._background_processor)
+        self.executor = ThreadPoolExecutor(max_workers=1)  # Resume processing
+        self._start_background_workers()
         
     def _init_resume_module(self):
         """Initialize resume processing components."""
@@ -399,7 +435,10 @@ class InterviewController:
                 "expected": q.expected_answer,
                 "type": q.question_type.value,
                 "section": q.section_source,
-                "keywords": q.keywords
+                "keywords": q.keywords,
+                # Only real answer text: follow-up hints are questions and keywords are
+                # bare skill words, so a one-word answer would match them almost exactly
+                "references": [q.expected_answer]
             }
         return None
 
@@ -492,73 +531,214 @@ class InterviewController:
         # Limit to top 5 most relevant topics
         return mapped_topics[:5] if mapped_topics else ['General']
 
+    def _start_background_workers(self):
+        """Transcription pool (transcribe_workers threads) + one scoring thread"""
+        self.background_threads = [
+            threading.Thread(target=self._background_processor, name=f"stt-worker-{i}", daemon=True)
+            for i in range(self.transcribe_workers)
+        ]
+        self.background_threads.append(threading.Thread(target=self._scoring_processor, name="scorer", daemon=True))
+        for thread in self.background_threads:
+            thread.start()
+
+    def _stop_background_workers(self):
+        for _ in range(self.transcribe_workers):
+            self.processing_queue.put(None)
+        self.scoring_queue.put(None)
+
+    def _queue_answer(self, audio, question, expected, topic):
+        """Hands a recorded answer to the background pipeline (returns immediately)"""
+        # A streamed answer was scored while it was spoken: its scorer goes along
+        scorer, self.answer_scorer = self.answer_scorer, None
+        if not isinstance(audio, StreamingTranscriber):
+            scorer = None
+        with self.lock:
+            seq = self.next_answer_seq
+            self.next_answer_seq += 1
+            self.active_tasks += 1
+        self.processing_queue.put((seq, audio, question, expected, topic, scorer))
+        return seq
+
+    def _make_answer_scorer(self, expected):
+        """IncrementalAnswerScorer for one answer (None if the references can't be encoded)"""
+        try:
+            return IncrementalAnswerScorer(
+                self.judge, self._answer_references(expected),
+                on_covered=lambda s: print(f"   [Judge] Answer covered the expected points (running score {s})")
+            )
+        except Exception as e:
+            print(f"   [Judge] Incremental scoring unavailable, batch scoring instead: {e}")
+            return None
+
     def _background_processor(self):
-        """Consumer Thread: Transcribes, Extracing Keywords, and Judges"""
+        """Transcription worker: Transcribes and checks Stop/Skip intents, then hands off to the scorer"""
         print("   [Background Worker Started]")
         while True:
+            task = self.processing_queue.get()
+            if task is None: break # Sentinel to stop
+            
             try:
-                task = self.processing_queue.get()
-                if task is None: break # Sentinel to stop
-                
-                audio, question, expected, topic = task
+                seq, audio, question, expected, topic, scorer = task
                 
-                # 1. Transcribe
-                text = self._transcribe_internal(audio)
+                # 1. Transcribe (several workers decode different answers in parallel).
+                # A streamed answer's scorer already follows its segments; otherwise
+                # each segment is scored as Whisper emits it.
+                on_segment = None
+                if scorer is None:
+                    scorer = self._make_answer_scorer(expected)
+                    on_segment = scorer.add_chunk if scorer is not None else None
+                try:
+                    text = self._transcribe_internal(audio, on_segment=on_segment)
+                except Exception as e:
+                    print(f"Error in transcription worker: {e}")
+                    text = ""
                 
-                # 1.5 Extract Keywords & Intents
+                # 1.5 Intents: acted on right away, not in answer order
                 text_lower = text.lower()
+                is_command = False
                 
                 # Check Stop Signals
                 for phrase in self.stop_phrases:
                     if phrase in text_lower:
                         print(f"   [Intent Detected] STOP Signal: '{text}'")
                         self.stop_signal = True
+                        is_command = True
                         break
                 
                 # Check Skip Signals
-                if not self.stop_signal:
+                if not is_command:
                     for phrase in self.skip_phrases:
                         if phrase in text_lower:
                             print(f"   [Intent Detected] SKIP Signal: '{text}'")
                             self.skip_signal = True
+                            is_command = True
                             break
                 
-                # Check Keywords (Simple substring match against known keys)
-                from core.question_bank import KEYWORD_INDEX
-                found_keywords = []
-                for kw in KEYWORD_INDEX.keys():
-                    # Simple heuristic: exact word match to avoid false positives
-                    if kw in text_lower:
-                        found_keywords.append(kw)
-                
-                    if kw in text_lower:
-                        found_keywords.append(kw)
+                # 2. Score: already known from the running score, no extra encode
+                # (None: judged in the scoring stage's batch instead)
+                try:
+                    score = scorer.final(text) if scorer is not None else None
+                except Exception as e:
+                    print(f"   [Judge] Incremental score failed, batch scoring instead: {e}")
+                    score = None
                 
-                if found_keywords:
-                    # Pick one relevant keyword to follow up on
-                    # We pick the longest one assuming it's most specific (e.g. 'react hooks' > 'hooks')
-                    best_kw = max(found_keywords, key=len)
-                    self.context_keywords.put(best_kw)
-                    print(f"   🔍 [Context] Keywords: {found_keywords} -> Queued: '{best_kw}'")
+                self.scoring_queue.put((seq, text, is_command, question, expected, topic, score))
+            finally:
+                self.processing_queue.task_done()
 
-                # 2. Judge
-                score, is_correct = self.judge.evaluate(text, expected)
+    def _scoring_processor(self):
+        """
+        Scoring stage: judges the transcribed answers that have no incremental score
+        yet (up to SCORE_BATCH_SIZE per judge call), then records them strictly in
+        the order they were asked.
+        """
+        ready = {}  # seq -> scored answer waiting for earlier answers
+        next_seq = 0
+        stop = False
+        while not stop:
+            batch = [self.scoring_queue.get()]
+            while len(batch) < SCORE_BATCH_SIZE:
+                try:
+                    batch.append(self.scoring_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                items = [item for item in batch if item is not None]
+                stop = len(items) < len(batch)
+                if items:
+                    try:
+                        results = self._score_answers(items)
+                    except Exception as e:
+                        # Every seq still needs a result, or later answers wait behind it forever
+                        print(f"Error in scoring worker: {e}")
+                        results = [
+                            (*(item[6] or (0, False)), self._answer_references(item[4])) for item in items
+                        ]
+                    for item, result in zip(items, results):
+                        ready[item[0]] = (item, result)
                 
-                # 3. Log
-                with self.lock:
-                    print(f"\n   [Processed] Q: {question[:30]}... | Ans: {text[:30]}... | Score: {score}")
-                    self.report_card.append({
-                        "topic": topic,
-                        "question": question,
-                        "user_ans": text,
-                        "expected": expected,
-                        "score": score
-                    })
-                    self.active_tasks -= 1
-                    
-                self.processing_queue.task_done()
-            except Exception as e:
-                print(f"Error in background worker: {e}")
+                while next_seq in ready:
+                    try:
+                        self._record_answer(*ready.pop(next_seq))
+                    except Exception as e:
+                        print(f"Error recording answer {next_seq}: {e}")
+                    finally:
+                        next_seq += 1
+            finally:
+                for _ in batch:
+                    self.scoring_queue.task_done()
+
+    @staticmethod
+    def _answer_references(expected):
+        """Expected answer(s) as a deduplicated list (resume questions may carry several)"""
+        references = [expected] if isinstance(expected, str) else list(expected or [])
+        return [ref for ref in dict.fromkeys(references) if ref and ref.strip()]
+
+    def _score_answers(self, items):
+        """
+        (score, is_correct, references) per item: incremental scores are used as
+        they are, the rest is judged in one batched call.
+        """
+        results = []
+        entries = {}  # index in items -> judge entry
+        for i, (seq, text, is_command, question, expected, topic, score) in enumerate(items):
+            # Several references: best match wins
+            references = self._answer_references(expected)
+            results.append((*score, references) if score is not None else None)
+            if score is None:
+                entries[i] = {
+                    "user_ans": text,
+                    "expected": references[0] if references else "",
+                    "references": references
+                }
+        
+        if entries:
+            judged = self.judge.rescore_report_card(list(entries.values()))
+            for (i, entry), (score, is_correct) in zip(entries.items(), judged):
+                results[i] = (score, is_correct, entry["references"])
+        return results
+
+    def _record_answer(self, item, result):
+        """Context for follow-ups + report card entry (called in answer order)"""
+        seq, text, is_command, question, expected, topic, _ = item
+        score, is_correct, references = result
+        
+        try:
+            # Check Keywords (one pass over the transcript, whole words only)
+            from core.question_bank import KEYWORD_MATCHER
+            found_keywords = KEYWORD_MATCHER.find_keywords(text.lower())
+            
+            if found_keywords:
+                # Pick one relevant keyword to follow up on
+                # We pick the longest one assuming it's most specific (e.g. 'react hooks' > 'hooks')
+                best_kw = max(found_keywords, key=len)
+                self.context_keywords.put(best_kw)
+                print(f"   🔍 [Context] Keywords: {found_keywords} -> Queued: '{best_kw}'")
+            
+            # Substantive answers feed semantic follow-ups (the embedding is cached now)
+            transcript = " ".join(text.split())
+            if len(transcript.split()) >= 5 and not is_command:
+                self.context_answers.put((seq, transcript))
+            
+            # New context: the question being prepared may change
+            planner = self.planner
+            if planner is not None and (found_keywords or not self.context_answers.empty()):
+                planner.update()
+        finally:
+            # The answer is reported even if follow-up context failed
+            with self.lock:
+                print(f"\n   [Processed] Q: {question[:30]}... | Ans: {text[:30]}... | Score: {score}")
+                self.report_card.append({
+                    "topic": topic,
+                    "question": question,
+                    "user_ans": text,
+                    "expected": references[0] if references else expected,
+                    "references": references,
+                    "score": score,
+                    "is_correct": is_correct
+                })
+                self.active_tasks -= 1
 
     def speak(self, text):
         """
@@ -572,6 +752,7 @@ class InterviewController:
             self.speaker.Speak(text, 0)  # 0 = SVSFDefault = synchronous
         except Exception as e:
             print(f"   [TTS Error] Could not speak: {e}")
+        self.turn_ended_at = time.time()
     
     def _stop_speech(self):
         """Stop any ongoing speech."""
@@ -582,61 +763,270 @@ class InterviewController:
             pass
 
     def listen(self):
-        q = queue.Queue()
+        """
+        Records until ENTER into the preallocated ring buffer. With STREAMING_STT
+        returns the StreamingTranscriber that has been transcribing during
+        recording, otherwise the full clip.
+        """
+        reader = self.audio_buffer.reader()
+        stream = StreamingTranscriber(self._transcribe_utterance, SAMPLE_RATE, source=reader) if STREAMING_STT else None
+        if stream is not None and self.answer_scorer is not None:
+            stream.subscribe(self.answer_scorer.add_chunk)  # Running score while the candidate speaks
+        if stream is not None and self.planner is not None:
+            stream.subscribe(self.planner.update)  # The next question follows the answer as it is spoken
         def callback(indata, frames, time, status):
-            q.put(indata.copy())
+            # Straight into the ring: no per-block allocation, no queue
+            self.audio_buffer.write(indata[:, 0])
         
         print("\n🎤 LISTENING... (Press ENTER to stop)")
         with sd.InputStream(samplerate=SAMPLE_RATE, channels=1, callback=callback):
             input("   [Recording] Press ENTER when done >>> ")
             
         print("⏹️ Stopped")
+        if stream is not None:
+            stream.finish()  # Only the last utterance is left to decode
+            return stream
         
-        chunks = []
-        while not q.empty(): chunks.append(q.get())
-        if not chunks: return np.array([])
-        return np.concatenate(chunks, axis=0).flatten()
+        reader.close()
+        audio = reader.snapshot()
+        if reader.lost_samples:
+            print(f"   ⚠️ [Audio] Answer longer than {MAX_ANSWER_SECONDS}s: "
+                  f"first {reader.lost_samples / SAMPLE_RATE:.1f}s dropped")
+        # The clip waits in the queue while the next answer is recorded: detach it from the ring (one copy)
+        return audio.copy() if audio.base is self.audio_buffer.data else audio
 
-    def _listen_for_answer(self):
-        """Listen wrapper that marks the controller as waiting for user input."""
+    def _listen_for_answer(self, expected=None):
+        """
+        Listen wrapper that marks the controller as waiting for user input.
+        With `expected`, a streamed answer is scored against it while it is spoken
+        (the scorer is picked up by _queue_answer).
+        """
+        self.answer_scorer = self._make_answer_scorer(expected) if expected is not None and STREAMING_STT else None
         self.awaiting_user_answer = True
         try:
             return self.listen()
         finally:
             self.awaiting_user_answer = False
+            self.turn_ended_at = time.time()
 
-    def _transcribe_internal(self, audio):
-        """Actual faster-whisper inference (Blocking)"""
+    def _transcribe_internal(self, audio, on_segment=None):
+        """
+        Actual faster-whisper inference (Blocking).
+        on_segment(text) is called for each segment as soon as it is decoded.
+        `audio` is a full clip or a StreamingTranscriber from listen() (decoded as a
+        full clip after all if the stream ends incomplete).
+        """
+        if isinstance(audio, StreamingTranscriber):
+            text = audio.result(on_segment=on_segment)
+            stats = audio.stats
+            print(f"   [STT] Streamed {stats['utterances']} utterances ({stats['audio_s']:.1f}s audio), "
+                  f"decode {stats['decode_s']:.2f}s, after stop {stats['tail_decode_s']:.2f}s")
+            if audio.source is not None and audio.source.lost_samples:
+                print(f"   ⚠️ [Audio] Transcription fell {MAX_ANSWER_SECONDS}s behind: "
+                      f"{audio.source.lost_samples / SAMPLE_RATE:.1f}s of audio overwritten")
+            if not audio.incomplete:
+                return text
+
+            # No utterance detected or the stream failed: an empty/partial transcript would be
+            # scored as the whole answer, so decode the full recording like a clip instead
+            reason = "streaming failed" if audio.error is not None else "no speech detected by the VAD"
+            if audio.segments:
+                on_segment = None  # already fed the partial segments; final(text) re-scores the full one
+            audio = audio.fallback_audio if audio.fallback_audio is not None else audio.snapshot()
+            print(f"   [STT] {reason}, decoding the full clip ({len(audio) / SAMPLE_RATE:.1f}s)")
+        
         if len(audio) == 0: return ""
         if audio.dtype != np.float32:
             audio = audio.astype(np.float32)
         
-        # faster-whisper returns a generator of segments
-        segments, info = self.stt_model.transcribe(audio, beam_size=5, language="en")
-        text = " ".join([segment.text for segment in segments])
-        return text.strip()
+        # Segments are decoded lazily and handed over one by one
+        return self.decoder.transcribe(audio, on_segment=on_segment)
+
+    def _transcribe_utterance(self, audio, prompt=""):
+        """One VAD utterance; the transcript so far keeps context across cuts"""
+        return self.decoder.transcribe(audio, initial_prompt=prompt[-200:] if prompt else None)
 
     def transcribe_blocking(self, audio):
         """For Intro only - we need result immediately"""
         print("⏳ Transcribing (Blocking for Intro)...")
         return self._transcribe_internal(audio)
 
+    def _pause_before_question(self, pause_s=QUESTION_PAUSE_S):
+        """
+        Natural pause before the next question, counted from the end of the
+        previous turn: time spent preparing the question is part of it, not added.
+        """
+        time.sleep(max(0.0, pause_s - (time.time() - self.turn_ended_at)))
+
+    def _predict_next_topic(self):
+        """Topic of the next DEEP_DIVE / MIX_ROUND question (None if it can't be known yet)"""
+        if self.state == InterviewState.MIX_ROUND:
+            # The pick is random anyway: draw it now, the plan keeps it
+            return random.choice(self.skills_detected) if self.skills_detected else "General"
+        if self.questions_asked_count + 1 < QUESTIONS_PER_TOPIC:
+            return self.current_topic
+        return self.skills_queue[0] if self.skills_queue else None
+
+    def _plan_question(self, topic, live_answer="", live_seq=None):
+        """
+        Picks the next question for `topic` WITHOUT consuming anything (context
+        queues, sampler, asked set) - _commit_question() applies the plan.
+        Semantic follow-up on the latest answer first (the one being given, once
+        it has a few words), then a keyword follow-up, then a topic question.
+        Runs on the speculative planner thread while the candidate answers.
+        """
+        from core.question_bank import get_question_by_keyword
+        
+        plan = {"state": self.state, "topic": topic, "q": None, "expected": None, "transition": "",
+                "source": None, "keyword": None, "answer_seq": None, "similarity": None}
+        asked = set(self.asked_q_hashes)
+        
+        # --- ADAPTIVE LOGIC: Check Context Queue ---
+        with self.context_answers.mutex:
+            recorded = [item for item in self.context_answers.queue if item[0] > self.last_context_seq]
+        answer_seq, answer = recorded[-1] if recorded else (None, None)
+        if live_seq is not None and len(live_answer.split()) >= 5:
+            answer_seq, answer = live_seq, live_answer
+        
+        # Semantic follow-up on the latest answer (one vector query)
+        if answer and self.question_index is not None:
+            match = self.question_index.best(
+                answer,
+                topics=self.skills_detected or [topic],
+                exclude=asked,
+                prefer_topic=topic
+            )
+            if match:
+                transitions = [
+                    "Building on your last answer. ",
+                    "Following up on that. ",
+                    "Related to what you just said. "
+                ]
+                plan.update(q=match[1], expected=match[2], source="semantic", answer_seq=answer_seq,
+                            similarity=match[3], transition=random.choice(transitions))
+                return plan
+        
+        # Keyword follow-up when nothing was semantically close (the keyword is used up either way)
+        with self.context_keywords.mutex:
+            keyword = self.context_keywords.queue[0] if self.context_keywords.queue else None
+        if keyword is not None:
+            plan["keyword"] = keyword
+            if keyword not in self.used_keywords:
+                res = get_question_by_keyword(keyword, topic, allowed_topics=self.skills_detected)
+                if res and res[1] not in asked:
+                    # Randomize transition for natural flow
+                    transitions = [
+                        f"Going back to what you mentioned about {keyword}. ",
+                        f"You touched on {keyword} earlier. ",
+                        f"Related to your point about {keyword}. ",
+                        f"Speaking of {keyword}. "
+                    ]
+                    plan.update(q=res[1], expected=res[2], source="keyword", transition=random.choice(transitions))
+                    return plan
+        
+        # Default Random if no context match
+        q, expected = self.question_sampler.peek(topic, exclude=asked)
+        if q:
+            plan.update(q=q, expected=expected, source="bank")
+        return plan
+
+    def _commit_question(self, plan):
+        """Applies a plan from _plan_question(): consumes its context, marks the question asked"""
+        while not self.context_answers.empty():
+            self.context_answers.get()
+        if plan["keyword"] is not None:
+            self.context_keywords.get_nowait()  # Only the main thread takes from it
+        
+        q, expected = plan["q"], plan["expected"]
+        if plan["source"] == "semantic":
+            print(f"   🔀 [Adapt] Semantic follow-up in {plan['topic']} (similarity {plan['similarity']:.2f})")
+            self.last_context_seq = max(self.last_context_seq, plan["answer_seq"])
+        elif plan["source"] == "keyword":
+            print(f"   🔀 [Adapt] Counter-questioning on '{plan['keyword']}'")
+            self.used_keywords.add(plan["keyword"])
+        elif plan["keyword"] in self.used_keywords:
+            print(f"   ⏭️ [Adapt] Skipping already used keyword: '{plan['keyword']}'")
+        
+        if plan["source"] == "bank":
+            q, expected = self.get_unique_question(plan["topic"])  # The peeked question
+        elif q:
+            self.asked_q_hashes.add(q)
+        return q, expected, plan["transition"]
+
+    def _start_speculative_planner(self):
+        """Start preparing the next question; called right before listening"""
+        self._take_speculative_plan()
+        topic = self._predict_next_topic()
+        if topic is None:
+            return
+        live_seq = self.next_answer_seq  # seq the answer being recorded will get
+        self.planner = SpeculativePlanner(
+            lambda live_answer: self._plan_question(topic, live_answer, live_seq), name="question-planner"
+        ).start()
+
+    def _take_speculative_plan(self, state=None, topic=None):
+        """
+        Stops the planner. Returns its plan if it was made for `state` / `topic`
+        (None: any topic) and its question is still unasked, else None.
+        """
+        planner, self.planner = self.planner, None
+        if planner is None:
+            return None
+        plan = planner.take()
+        if plan is None or state is None:
+            return None
+        if plan["state"] != state or (topic is not None and plan["topic"] != topic):
+            print(f"   [Plan] Prepared question discarded (planned for {plan['topic']})")
+            return None
+        if plan["q"] in self.asked_q_hashes:
+            return None
+        stats = planner.stats
+        print(f"   [Plan] Next question prepared during the answer "
+              f"({stats['plans']} plans, {stats['plan_s'] * 1000:.0f} ms off the main thread)")
+        return plan
+
     def get_unique_question(self, topic):
-        from core.question_bank import get_all_questions
-        options = get_all_questions(topic)
-        random.shuffle(options)
-        for q, ans in options:
-            if q not in self.asked_q_hashes:
-                self.asked_q_hashes.add(q)
-                return q, ans
-        return None, None  # Return None if exhausted instead of loop
+        q, ans = self.question_sampler.next(topic, exclude=self.asked_q_hashes)
+        if q is not None:
+            self.asked_q_hashes.add(q)
+        return q, ans  # (None, None) if exhausted instead of loop
 
-    def generate_report(self):
+    def rescore_report(self, threshold=None):
+        """
+        Re-score every answer in the report card in one batched pass
+        (e.g. after changing the pass threshold). Returns the number of entries.
+        """
+        if threshold is None:
+            from core.answer_evaluator import CORRECT_THRESHOLD
+            threshold = CORRECT_THRESHOLD
+        
+        with self.lock:
+            start = time.time()
+            results = self.judge.rescore_report_card(self.report_card, threshold)
+            for entry, (score, is_correct) in zip(self.report_card, results):
+                entry["score"] = score
+                entry["is_correct"] = is_correct
+            print(f"   [Judge] Re-scored {len(results)} answers in {time.time() - start:.2f}s")
+            return len(results)
+
+    def generate_report(self, rescore_threshold=None):
         if self.report_generated: return # Idempotency check
         self.report_generated = True
         
         print("⏳ Waiting for pending transcriptions...")
-        self.processing_queue.join() # Wait for all background tasks
+        self.processing_queue.join() # Wait for all transcriptions...
+        self.scoring_queue.join()    # ...and their scores
+        
+        decoder = getattr(self, "decoder", None)
+        if decoder is not None and decoder.stats["clips"]:
+            stats = decoder.summary()
+            print(f"   [STT] Decoding ({decoder.mode}): {stats['segments']} segments, "
+                  f"{stats['fallbacks']} beam fallbacks ({stats['fallback_rate']:.0%}, {stats['beam_wins']} improved), "
+                  f"fallback time {stats['fallback_s']:.1f}s ({stats['fallback_time_share']:.0%} of decoding)")
+        
+        # Optional bulk re-score with a different pass threshold
+        if rescore_threshold is not None:
+            self.rescore_report(rescore_threshold)
         
         filename = "interview_feedback.txt"
         with open(filename, "w", encoding="utf-8") as f:
@@ -703,10 +1093,9 @@ class InterviewController:
         
         # We need to listen, but softly handle if audio fails
         try:
-            audio = self._listen_for_answer()
+            audio = self._listen_for_answer("Practical usage summary.")
             if len(audio) > 0:
-                self.active_tasks += 1
-                self.processing_queue.put((audio, final_q, "Practical usage summary.", "Final"))
+                self._queue_answer(audio, final_q, "Practical usage summary.", "Final")
                 print(f"   -> Answer queued for processing ({self.active_tasks} pending)...")
         except Exception as e:
             print(f"   [Checkout Error] Could not record answer: {e}")
@@ -760,12 +1149,11 @@ class InterviewController:
                     q, expected = self.get_unique_question(topic)
                     
                     if q:
-                        time.sleep(1)
+                        self._pause_before_question(1)
                         self.speak(q)
-                        audio = self._listen_for_answer()
+                        audio = self._listen_for_answer(expected)
                         
-                        self.active_tasks += 1
-                        self.processing_queue.put((audio, q, expected, topic))
+                        self._queue_answer(audio, q, expected, topic)
                         print(f"   -> Warmup answer queued ({self.active_tasks} pending)...")
                         
                         warmup_count += 1
@@ -809,6 +1197,7 @@ class InterviewController:
                     and not self.awaiting_user_answer
                 ):
                     print("   [Main] Resume questions ready! Switching immediately to resume deep dive...")
+                    self._take_speculative_plan()  # Drop the local question prepared meanwhile
                     self.state = InterviewState.RESUME_DEEP_DIVE
                     self.questions_asked_count = 0
                     self.speak("I've analyzed your resume. Let's dive deeper into your experience.")
@@ -822,7 +1211,7 @@ class InterviewController:
                     resume_q = self._get_resume_question()
                     
                     if resume_q:
-                        time.sleep(2)
+                        self._pause_before_question()
                         
                         # Add transition for variety
                         transitions = [
@@ -836,15 +1225,14 @@ class InterviewController:
                         full_q = prefix + resume_q["question"] if prefix else resume_q["question"]
                         self.speak(full_q)
                         
-                        audio = self._listen_for_answer()
+                        audio = self._listen_for_answer(resume_q["references"])
                         
-                        self.active_tasks += 1
-                        self.processing_queue.put((
+                        self._queue_answer(
                             audio, 
                             resume_q["question"], 
-                            resume_q["expected"], 
+                            resume_q["references"], 
                             f"Resume:{resume_q['section']}"
-                        ))
+                        )
                         print(f"   -> Resume answer queued ({self.active_tasks} pending)...")
                         
                         self.questions_asked_count += 1
@@ -957,7 +1345,14 @@ class InterviewController:
                 
                 # 1. Ask Question (DEEP_DIVE or MIX_ROUND)
                 if self.state == InterviewState.DEEP_DIVE or self.state == InterviewState.MIX_ROUND:
-                    if self.state == InterviewState.DEEP_DIVE:
+                    # Prepared while the last answer was being given (None: plan now)
+                    plan = self._take_speculative_plan(
+                        self.state, self.current_topic if self.state == InterviewState.DEEP_DIVE else None
+                    )
+                    
+                    if plan is not None:
+                        topic = plan["topic"]  # Mix round: drawn by the planner
+                    elif self.state == InterviewState.DEEP_DIVE:
                         topic = self.current_topic
                     else:
                         # RESTRICTED MIX ROUND: Only ask about skills from resume/interview
@@ -967,38 +1362,10 @@ class InterviewController:
                             topic = random.choice(pool)
                         else:
                             topic = "General"  # Fallback only if nothing detected
-                        
-                    q, expected = None, None
-                    transition_phrase = ""
-                    
-                    # --- ADAPTIVE LOGIC: Check Context Queue ---
-                    from core.question_bank import get_question_by_keyword
-                    
-                    if not self.context_keywords.empty():
-                        last_keyword = self.context_keywords.get()
-                        
-                        if last_keyword not in self.used_keywords:
-                            res = get_question_by_keyword(last_keyword, topic, allowed_topics=self.skills_detected)
-                            
-                            if res and res[1] not in self.asked_q_hashes:
-                                print(f"   🔀 [Adapt] Counter-questioning on '{last_keyword}'")
-                                self.used_keywords.add(last_keyword)
-                                q, expected = res[1], res[2]
-                                self.asked_q_hashes.add(q)
-                                # Randomize transition for natural flow
-                                transitions = [
-                                    f"Going back to what you mentioned about {last_keyword}. ",
-                                    f"You touched on {last_keyword} earlier. ",
-                                    f"Related to your point about {last_keyword}. ",
-                                    f"Speaking of {last_keyword}. "
-                                ]
-                                transition_phrase = random.choice(transitions)
-                        else:
-                            print(f"   ⏭️ [Adapt] Skipping already used keyword: '{last_keyword}'")
                     
-                    # Default Random if no context match
-                    if not q:
-                        q, expected = self.get_unique_question(topic)
+                    if plan is None:
+                        plan = self._plan_question(topic)
+                    q, expected, transition_phrase = self._commit_question(plan)
                     
                     # Handle Exhaustion
                     if not q: 
@@ -1009,17 +1376,17 @@ class InterviewController:
                         else:
                              break # Stop if Mix round exhausted (rare)
                     else:
-                        # DELAY: 2 Seconds as requested
-                        time.sleep(2)
+                        # DELAY: 2 Seconds as requested (from the end of the answer)
+                        self._pause_before_question()
                         full_q = transition_phrase + q
                         self.speak(full_q)
                         
-                        # 2. Record (Blocking)
-                        audio = self._listen_for_answer()
+                        # 2. Record (Blocking) - the next question is planned meanwhile
+                        self._start_speculative_planner()
+                        audio = self._listen_for_answer(expected)
                         
                         # 3. Submit to Background (Instant)
-                        self.active_tasks += 1
-                        self.processing_queue.put((audio, q, expected, topic))
+                        self._queue_answer(audio, q, expected, topic)
                         print(f"   -> Answer queued for processing ({self.active_tasks} pending)...")
                         
                         # 4. Decide Next Move (Immediately)
@@ -1060,12 +1427,13 @@ class InterviewController:
             import traceback
             traceback.print_exc()
         finally:
+            self._take_speculative_plan()  # Stop planning
             # Skip checkout question - go directly to report generation
             self.speak("Interview complete. Generating feedback...")
             self.generate_report() # Ensure report is ALWAYS generated on exit
             
         # Cleanup
-        self.processing_queue.put(None)
+        self._stop_background_workers()
         self.executor.shutdown()
 
     def provide_verbal_feedback(self):
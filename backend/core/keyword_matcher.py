@@ -0,0 +1,110 @@
+"""
+Keyword Matcher
+Finds every known keyword in a transcript in ONE linear pass (Aho-Corasick).
+
+The automaton is compiled once from the keyword index; scanning costs
+O(len(text) + matches) no matter how many keywords there are, instead of
+one substring search per keyword.
+
+Matches respect word boundaries: "java" is not found inside "javascript",
+"join" is not found inside "joined".
+
+    matcher = KeywordMatcher(KEYWORD_INDEX)
+    matcher.find_all("I tuned the index on that join")
+    # [KeywordMatch(keyword='index', start=12, end=17), KeywordMatch(keyword='join', start=26, end=30)]
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+
+class KeywordMatch(NamedTuple):
+    keyword: str
+    start: int  # offset of the first occurrence in the scanned text
+    end: int
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """Compiled multi-pattern matcher (case-insensitive, word-boundary aware)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Args:
+            keywords: Keywords to match (any iterable, e.g. the KEYWORD_INDEX dict)
+        """
+        self.keywords: List[str] = list(dict.fromkeys(kw.lower() for kw in keywords if kw))
+
+        # State 0 is the root. goto[s][ch] -> state, fail[s] -> state,
+        # output[s] -> ids of keywords ending in state s (including via fail links)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for kw_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = nxt
+            self._output[state] += (kw_id,)
+
+        # Breadth-first: a state's fail link always points to a shallower state,
+        # whose transitions are complete by the time it is inherited.
+        # Fail links are folded into _delta, so scanning never follows them.
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])] + [None] * (len(self._goto) - 1)
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            if state:
+                self._delta[state] = {**self._delta[self._fail[state]], **self._goto[state]}
+            for ch, nxt in self._goto[state].items():
+                pending.append(nxt)
+                self._fail[nxt] = self._delta[self._fail[state]].get(ch, 0) if state else 0
+                self._output[nxt] += self._output[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Keywords found in `text` as whole words, deduplicated (first occurrence),
+        ordered by position.
+        """
+        text = text.lower()
+        delta, output, keywords = self._delta, self._output, self.keywords
+        length = len(text)
+
+        found: Dict[int, KeywordMatch] = {}
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if not output[state]:
+                continue
+
+            end = i + 1
+            for kw_id in output[state]:
+                if kw_id in found:
+                    continue
+                keyword = keywords[kw_id]
+                start = end - len(keyword)
+                # Boundaries only matter next to word characters ("c++" may end in punctuation)
+                if start > 0 and _is_word_char(keyword[0]) and _is_word_char(text[start - 1]):
+                    continue
+                if end < length and _is_word_char(keyword[-1]) and _is_word_char(text[end]):
+                    continue
+                found[kw_id] = KeywordMatch(keyword, start, end)
+
+        return sorted(found.values(), key=lambda m: m.start)
+
+    def find_keywords(self, text: str) -> List[str]:
+        """Just the matched keywords, ordered by first occurrence"""
+        return [m.keyword for m in self.find_all(text)]
@@ -0,0 +1,302 @@
+"""
+Question Store
+Compact on-disk question bank, memory-mapped and decoded lazily per topic.
+
+QUESTION_REPO used to be a Python dict literal, parsed and held in memory by
+every process that imports the question bank. A store file keeps the same data
+in one binary file that the OS pages in on demand (and shares between
+processes):
+
+    magic     8 bytes    b"QSTORE\\x00\\x01"
+    header    uint64 length + UTF-8 JSON:
+                {"count": N, "topics": {topic: [first_row, n_rows]},
+                 "keywords": [offset, length], "fingerprint": ...}
+    offsets   uint64[2N + 1]  (8-byte aligned) - string i is blob[offsets[i]:offsets[i + 1]],
+              row r = (question 2r, answer 2r + 1)
+    blob      UTF-8 question / answer texts, grouped by topic
+    keywords  UTF-8 JSON {keyword: [row, ...]} (precomputed keyword index)
+
+QuestionStore is a read-only Mapping topic -> ((question, answer), ...), so it
+is a drop-in replacement for the QUESTION_REPO dict. A topic is decoded (and
+kept) the first time it is looked up; bulk iteration (items() / values() /
+iter_rows()) decodes without keeping anything, so a startup pass over the whole
+bank does not pin it in memory. The keyword table is parsed only when the
+keyword index is.
+
+Build offline (from backend/):
+    python -m core.question_store build                      # built-in bank
+    python -m core.question_store build --from-json bank.json --embeddings
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ==================== CONFIG ====================
+QUESTION_STORE_PATH = os.getenv(
+    "QUESTION_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ml", "data", "question_bank.qbin")
+)
+
+MAGIC = b"QSTORE\x00\x01"
+_LENGTH = struct.Struct("<Q")
+_OFFSET_PAIR = struct.Struct("<QQ")
+
+QuestionPairs = Sequence[Tuple[str, str]]
+
+
+def _align(offset: int, boundary: int = 8) -> int:
+    return (offset + boundary - 1) // boundary * boundary
+
+
+def write_question_store(
+    path: str,
+    repo: Dict[str, QuestionPairs],
+    keyword_fn: Optional[Callable[[str], Iterable[str]]] = None,
+) -> str:
+    """
+    Write `repo` (topic -> [(question, answer)]) as a store file.
+
+    Args:
+        path: Output file (written atomically)
+        repo: Question bank to store
+        keyword_fn: question text -> keywords, precomputed into the keyword table
+    Returns: the store's fingerprint
+    """
+    topics: Dict[str, List[int]] = {}
+    texts: List[bytes] = []
+    keywords: Dict[str, List[int]] = {}
+    digest = hashlib.sha256()
+
+    row = 0
+    for topic, pairs in repo.items():
+        topics[topic] = [row, len(pairs)]
+        for q_text, ans_text in pairs:
+            for text in (q_text, ans_text):
+                encoded = text.encode("utf-8")
+                texts.append(encoded)
+                digest.update(_LENGTH.pack(len(encoded)))
+                digest.update(encoded)
+            if keyword_fn is not None:
+                for kw in keyword_fn(q_text):
+                    keywords.setdefault(kw, []).append(row)
+            row += 1
+        digest.update(topic.encode("utf-8"))
+
+    offsets = struct.pack(f"<{len(texts) + 1}Q", 0, *accumulate(len(t) for t in texts))
+    blob = b"".join(texts)
+    keyword_blob = json.dumps(keywords, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # Header size depends on the keyword offset it contains: fix the width first
+    header = {"count": row, "topics": topics, "keywords": [0, len(keyword_blob)], "fingerprint": digest.hexdigest()}
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8") + b" " * 24
+    offsets_at = _align(len(MAGIC) + _LENGTH.size + len(header_bytes))
+    keywords_at = offsets_at + len(offsets) + len(blob)
+    header["keywords"][0] = keywords_at
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    header_bytes += b" " * (offsets_at - len(MAGIC) - _LENGTH.size - len(header_bytes))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + f".{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header_bytes)))
+        f.write(header_bytes)
+        f.write(offsets)
+        f.write(blob)
+        f.write(keyword_blob)
+    os.replace(tmp_path, path)
+    return header["fingerprint"]
+
+
+class QuestionStore(Mapping):
+    """
+    Read-only, memory-mapped question bank: topic -> ((question, answer), ...)
+
+    Usage:
+        store = QuestionStore(QUESTION_STORE_PATH)
+        store["Python"][0]        # decodes the Python topic once
+        store.keyword_index()     # keyword -> [(topic, question, answer)], lazy
+    """
+
+    def __init__(self, path: str = QUESTION_STORE_PATH):
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a question store")
+            (header_len,) = _LENGTH.unpack_from(self._mm, len(MAGIC))
+            start = len(MAGIC) + _LENGTH.size
+            header = json.loads(bytes(self._mm[start:start + header_len]).decode("utf-8"))
+
+            self.count: int = header["count"]
+            self.fingerprint: str = header["fingerprint"]
+            self._topics: Dict[str, Tuple[int, int]] = {t: tuple(span) for t, span in header["topics"].items()}
+            self._keyword_span: Tuple[int, int] = tuple(header["keywords"])
+            self._offsets_start = start + header_len
+            self._blob_start = self._offsets_start + _LENGTH.size * (2 * self.count + 1)
+            if self._blob_start > len(self._mm):
+                raise ValueError("truncated offset table")
+        except (KeyError, TypeError, ValueError, struct.error) as e:
+            self._mm.close()
+            raise ValueError(f"Corrupt question store {self.path}: {e}") from e
+
+        self._decoded: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self._keyword_index: Optional["KeywordIndexView"] = None
+
+    # ==================== Mapping ====================
+
+    def __getitem__(self, topic: str) -> Tuple[Tuple[str, str], ...]:
+        pairs = self._decoded.get(topic)
+        if pairs is None:
+            pairs = self._decoded[topic] = self._pairs(topic)
+        return pairs
+
+    def __iter__(self):
+        return iter(self._topics)
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def __contains__(self, topic) -> bool:
+        return topic in self._topics
+
+    def items(self):
+        """(topic, pairs) for every topic; topics not already decoded are not cached"""
+        for topic in self._topics:
+            yield topic, self._pairs(topic)
+
+    def values(self):
+        for _, pairs in self.items():
+            yield pairs
+
+    def _pairs(self, topic: str) -> Tuple[Tuple[str, str], ...]:
+        pairs = self._decoded.get(topic)
+        if pairs is None:
+            first, n_rows = self._topics[topic]
+            pairs = tuple(self.row(r) for r in range(first, first + n_rows))
+        return pairs
+
+    # ==================== Rows ====================
+
+    def _text(self, i: int) -> str:
+        start, end = _OFFSET_PAIR.unpack_from(self._mm, self._offsets_start + _LENGTH.size * i)
+        start += self._blob_start
+        end += self._blob_start
+        return self._mm[start:end].decode("utf-8")
+
+    def row(self, r: int) -> Tuple[str, str]:
+        """(question, answer) of global row `r`"""
+        return self._text(2 * r), self._text(2 * r + 1)
+
+    def iter_rows(self) -> Iterable[Tuple[str, str]]:
+        """Every (question, answer) in row order, decoded on the fly (nothing cached)"""
+        for r in range(self.count):
+            yield self.row(r)
+
+    def topic_of(self, r: int) -> str:
+        for topic, (first, n_rows) in self._topics.items():
+            if first <= r < first + n_rows:
+                return topic
+        raise IndexError(r)
+
+    def topic_size(self, topic: str) -> int:
+        """Number of questions in `topic` without decoding it"""
+        return self._topics[topic][1]
+
+    def topic_spans(self) -> Dict[str, Tuple[int, int]]:
+        """topic -> (first_row, n_rows), rows of a topic are contiguous"""
+        return dict(self._topics)
+
+    def keyword_index(self) -> "KeywordIndexView":
+        """Precomputed keyword -> questions table (parsed on first call)"""
+        if self._keyword_index is None:
+            offset, length = self._keyword_span
+            table = json.loads(self._mm[offset:offset + length].decode("utf-8")) if length else {}
+            self._keyword_index = KeywordIndexView(self, table)
+        return self._keyword_index
+
+    def info(self) -> Dict[str, object]:
+        return {
+            "path": self.path,
+            "questions": self.count,
+            "topics": {t: n for t, (_, n) in self._topics.items()},
+            "decoded_topics": sorted(self._decoded),
+            "size_kb": round(len(self._mm) / 1024, 1),
+        }
+
+
+class KeywordIndexView(Mapping):
+    """keyword -> [(topic, question, answer)], resolved from row ids on access"""
+
+    def __init__(self, store: QuestionStore, table: Dict[str, List[int]]):
+        self.store = store
+        self._table = table
+
+    def __getitem__(self, keyword: str) -> List[Tuple[str, str, str]]:
+        return [(self.store.topic_of(r), *self.store.row(r)) for r in self._table[keyword]]
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, keyword) -> bool:
+        return keyword in self._table
+
+
+# ==================== Offline build ====================
+
+def _build(args):
+    from core.question_bank import extract_keywords
+
+    if args.from_json:
+        with open(args.from_json, "r", encoding="utf-8") as f:
+            repo = {topic: [tuple(pair) for pair in pairs] for topic, pairs in json.load(f).items()}
+    else:
+        from core.question_data import BUILTIN_QUESTIONS
+        repo = BUILTIN_QUESTIONS
+
+    start = time.time()
+    fingerprint = write_question_store(args.output, repo, keyword_fn=extract_keywords)
+    store = QuestionStore(args.output)
+    print(f"[STORE] Wrote {store.count} questions in {len(store)} topics to {args.output} "
+          f"({store.info()['size_kb']} KB, {time.time() - start:.2f}s, fingerprint {fingerprint[:12]})")
+
+    if args.embeddings:
+        # Pre-build the memory-mapped embedding indexes the service would build on first start
+        from ml.embeddings import get_embedding_engine
+        from core.answer_evaluator import load_answer_index
+        from core.semantic_question_index import SemanticQuestionIndex
+
+        engine = get_embedding_engine()
+        SemanticQuestionIndex(engine, store)
+        load_answer_index(engine, store)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the on-disk question store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Write a store file (and optionally the embedding indexes)")
+    build.add_argument("--from-json", help="JSON {topic: [[question, answer], ...]} (default: built-in bank)")
+    build.add_argument("--output", default=QUESTION_STORE_PATH)
+    build.add_argument("--embeddings", action="store_true",
+                       help="Also build the question / expected-answer embedding indexes")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        _build(args)
@@ -0,0 +1,174 @@
+"""
+Semantic Question Index
+Retrieves bank questions by meaning instead of by a single shared word.
+
+All QUESTION_REPO questions are embedded once (memory-mapped EmbeddingIndex
+"questions", rebuilt only when the bank or model changes) and laid out as one
+contiguous [N, dim] matrix, ordered by topic. For a QuestionStore bank the
+index rows ARE the store rows (keyed by the store fingerprint), so the mmap'd
+matrix is used as is and only the questions a search returns are decoded:
+
+    rows  0 .. 9    Java
+    rows 10 .. 19   Python
+    ...
+
+A query is one encode of the candidate's answer (usually an embedding-cache hit,
+the answer was just scored) plus a brute-force matrix-vector product over the
+partitions of the allowed topics. With ~100 questions that is well under a
+millisecond - no ANN structure needed.
+
+    index = SemanticQuestionIndex(judge.engine)
+    for topic, question, answer, similarity in index.search(answer_text, k=3, topics=["Java"]):
+        ...
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.question_store import QuestionStore
+from ml.embeddings import EmbeddingIndex
+from utils.stage_timing import stage
+
+# ==================== CONFIG ====================
+# Cosine similarity below which a question is not considered related to the answer
+MIN_SIMILARITY = float(os.getenv("FOLLOW_UP_MIN_SIMILARITY", "0.45"))
+
+# (topic, question, expected_answer, similarity)
+QuestionMatch = Tuple[str, str, str, float]
+
+
+class SemanticQuestionIndex:
+    """Top-k bank questions for a text, searched per topic partition"""
+
+    def __init__(self, engine, question_repo: Optional[Dict[str, Sequence[Tuple[str, str]]]] = None):
+        """
+        Args:
+            engine: Shared EmbeddingEngine (same model as the judge)
+            question_repo: topic -> [(question, answer)] or a QuestionStore, defaults to QUESTION_REPO
+        """
+        if question_repo is None:
+            from core.question_bank import QUESTION_REPO
+            question_repo = QUESTION_REPO
+
+        self.engine = engine
+        self.partitions: Dict[str, slice] = {}
+        self._store: Optional[QuestionStore] = None
+        self._entries: List[Tuple[str, str, str]] = []  # (topic, question, answer) per row
+
+        if isinstance(question_repo, QuestionStore):
+            self._store = question_repo
+            for topic, (first, n_rows) in question_repo.topic_spans().items():
+                self.partitions[topic] = slice(first, first + n_rows)
+            self._size = question_repo.count
+            index = EmbeddingIndex("questions").build_or_load(
+                engine, lambda: [q for q, _ in question_repo.iter_rows()],
+                source_fingerprint=question_repo.fingerprint
+            )
+            # Already one row per store row, grouped by topic
+            self.matrix = index.matrix
+        else:
+            for topic, pairs in question_repo.items():
+                start = len(self._entries)
+                self._entries.extend((topic, q_text, ans_text) for q_text, ans_text in pairs)
+                self.partitions[topic] = slice(start, len(self._entries))
+            self._size = len(self._entries)
+
+            questions = [q_text for _, q_text, _ in self._entries]
+            index = EmbeddingIndex("questions").build_or_load(engine, questions)
+            # Gather into topic order once (a question may repeat across topics);
+            # partitions are then plain row slices of one contiguous matrix.
+            self.matrix = np.ascontiguousarray(
+                np.stack([index.lookup(q) for q in questions]) if questions
+                else np.zeros((0, engine.dimension), dtype=np.float32),
+                dtype=np.float32
+            )
+        print(f"[INDEX] Semantic question index ready ({self._size} questions, {len(self.partitions)} topics)")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def entry(self, row: int) -> Tuple[str, str, str]:
+        """(topic, question, expected_answer) of one row - decoded on demand from a store"""
+        if self._store is None:
+            return self._entries[row]
+        return (self._store.topic_of(row), *self._store.row(row))
+
+    def encode(self, text: str) -> np.ndarray:
+        """Normalized query vector (served from the embedding cache when the text was just scored)"""
+        return self.engine.encode([text], normalize=True)[0]
+
+    def search(
+        self,
+        query,
+        k: int = 3,
+        topics: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        min_similarity: float = MIN_SIMILARITY,
+    ) -> List[QuestionMatch]:
+        """
+        Most similar questions, best first.
+
+        Args:
+            query: Text (e.g. the candidate's answer) or a precomputed normalized vector
+            k: Maximum number of results
+            topics: Only search these topic partitions (None = all)
+            exclude: Question texts to skip (e.g. already asked)
+            min_similarity: Drop results below this cosine similarity
+        """
+        if k <= 0 or not len(self):
+            return []
+        vector = self.encode(query) if isinstance(query, str) else np.asarray(query, dtype=np.float32)
+
+        with stage("questions", "search"):
+            if topics is None:
+                rows = None
+                similarities = self.matrix @ vector
+            else:
+                parts = [self.partitions[t] for t in dict.fromkeys(topics) if t in self.partitions]
+                if not parts:
+                    return []
+                rows = np.concatenate([np.arange(p.start, p.stop) for p in parts])
+                similarities = np.concatenate([self.matrix[p] @ vector for p in parts])
+
+            excluded = set(exclude) if exclude else ()
+            # Over-fetch by the number of exclusions so k survivors remain
+            fetch = min(len(similarities), k + len(excluded))
+            if fetch < len(similarities):
+                top = np.argpartition(-similarities, fetch - 1)[:fetch]
+            else:
+                top = np.arange(len(similarities))
+            top = top[np.argsort(-similarities[top], kind="stable")]
+
+        results: List[QuestionMatch] = []
+        for i in top.tolist():
+            similarity = float(similarities[i])
+            if similarity < min_similarity:
+                break
+            row = i if rows is None else int(rows[i])
+            topic, question, answer = self.entry(row)
+            if question in excluded:
+                continue
+            results.append((topic, question, answer, similarity))
+            if len(results) == k:
+                break
+        return results
+
+    def best(self, query, topics=None, exclude=None, prefer_topic: Optional[str] = None,
+             min_similarity: float = MIN_SIMILARITY) -> Optional[QuestionMatch]:
+        """
+        Single follow-up question: the closest match in `prefer_topic` if there is
+        one, otherwise the closest within `topics`. None if nothing is related enough.
+        """
+        vector = self.encode(query) if isinstance(query, str) else query
+        if prefer_topic is not None:
+            matches = self.search(vector, 1, [prefer_topic], exclude, min_similarity)
+            if matches:
+                return matches[0]
+        matches = self.search(vector, 1, topics, exclude, min_similarity)
+        return matches[0] if matches else None
@@ -0,0 +1,102 @@
+"""
+Speculative Planner
+Prepares the next question while the candidate is still answering.
+
+Choosing the next question (semantic follow-up, keyword follow-up, topic
+question) used to start only after ENTER, while the main thread had been idle
+in listen() the whole answer. SpeculativePlanner runs the planning function on
+a background thread during the answer: once right away (context from earlier
+answers) and again whenever its input changes - each streamed segment of the
+answer being given, or new context from the scoring thread. When the answer
+ends, take() hands over the latest plan without planning on the main thread:
+
+    planner = SpeculativePlanner(lambda live_answer: plan_question(topic, live_answer)).start()
+    stream.subscribe(planner.update)   # re-plan as the answer is transcribed
+    ...
+    plan = planner.take()              # ready the instant the answer ends
+
+Plans must be side-effect free: superseded plans are dropped, so nothing may be
+consumed until the caller commits the plan it took.
+"""
+
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+
+class SpeculativePlanner:
+    """Background re-planning of one decision from a growing input (latest plan wins)"""
+
+    def __init__(self, plan_fn: Callable[[str], Any], name: str = "planner"):
+        """
+        Args:
+            plan_fn: live_text -> plan (the text passed to update() so far, joined)
+            name: Thread name
+        """
+        self.plan_fn = plan_fn
+        self.stats = {"plans": 0, "updates": 0, "plan_s": 0.0}
+        self.planned_at: Optional[float] = None  # when the latest plan was finished
+        self.error: Optional[BaseException] = None
+
+        self._cond = threading.Condition()
+        self._parts: List[str] = []
+        self._version = 0    # bumped by every update()
+        self._planned = -1   # input version the latest plan was made from
+        self._plan = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> "SpeculativePlanner":
+        self._thread.start()
+        return self
+
+    def update(self, text: Optional[str] = None):
+        """
+        Input changed: `text` (e.g. one transcribed segment) is appended to the
+        live text; None just asks for a re-plan (e.g. new context arrived).
+        """
+        with self._cond:
+            if self._stopped:
+                return
+            text = (text or "").strip()
+            if text:
+                self._parts.append(text)
+            self._version += 1
+            self.stats["updates"] += 1
+            self._cond.notify_all()
+
+    def take(self, timeout: Optional[float] = None):
+        """
+        Stop planning and return the latest plan (None if planning failed).
+        Only waits for a plan that is already being computed - or for the first
+        one, if the answer ended before it was done.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        return self._plan
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._stopped or self._version != self._planned)
+                if self._stopped and (self._planned >= 0 or self.error is not None):
+                    return
+                version = self._version
+                live_text = " ".join(self._parts)
+
+            start = time.time()
+            try:
+                self._plan = self.plan_fn(live_text)
+            except Exception as e:
+                # Keep the previous plan; the caller falls back to planning itself
+                self.error = e
+                print(f"   [Plan] Speculative planning failed: {e}")
+
+            with self._cond:
+                self._planned = version
+                self.planned_at = time.time()
+                self.stats["plans"] += 1
+                self.stats["plan_s"] += self.planned_at - start
@@ -0,0 +1,281 @@
+"""
+Streaming Transcriber
+Transcribes an answer WHILE the candidate is speaking.
+
+Audio comes from a RingReader over the microphone's AudioRingBuffer (zero-copy
+views, the callback only writes into the ring) or is pushed with feed(). A
+worker thread runs an energy-based voice-activity detector over the stream,
+cuts it into utterances at pauses, and transcribes each utterance as soon as
+it closes. When the candidate stops, only the last utterance is left to decode:
+
+    stream = StreamingTranscriber(transcribe_utterance, source=ring.reader())
+    with sd.InputStream(..., callback=lambda indata, *_: ring.write(indata[:, 0])):
+        input("Press ENTER when done")
+    text = stream.result(on_segment=scorer.add_chunk)   # replays segments already decoded
+
+transcribe(audio, prompt) receives one float32 utterance plus the transcript so
+far (useful as a decoder prompt for context across cuts) and returns its text.
+
+If the stream ends `incomplete` - the VAD never opened an utterance (quiet
+microphone, steady background noise) or the worker failed - the transcript does
+not stand for the answer: the caller decodes `fallback_audio` (the whole
+recording, copied before the ring moves on) as one clip instead.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional
+
+import numpy as np
+
+# ==================== CONFIG ====================
+SOURCE_POLL_S = 0.05         # Ring reader wait per poll
+VAD_FRAME_MS = 30            # Energy is measured per frame
+VAD_ENERGY_THRESHOLD = 0.01  # Minimum RMS (float32 samples) that can count as speech
+VAD_NOISE_RATIO = 3.0        # Speech must also be this many times louder than the noise floor
+VAD_MIN_SILENCE_MS = 700     # Pause that closes an utterance
+VAD_MIN_SPEECH_MS = 250      # Shorter bursts (clicks, coughs) are dropped
+VAD_PRE_ROLL_MS = 300        # Audio kept before speech onset (soft word starts)
+VAD_MAX_UTTERANCE_S = 20.0   # Force a cut in long monologues
+
+
+class EnergyVAD:
+    """
+    Frame-energy voice-activity detector with an adaptive noise floor.
+    push(samples) returns the utterances (float32 arrays) closed by these samples.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        frame_ms: int = VAD_FRAME_MS,
+        energy_threshold: float = VAD_ENERGY_THRESHOLD,
+        noise_ratio: float = VAD_NOISE_RATIO,
+        min_silence_ms: int = VAD_MIN_SILENCE_MS,
+        min_speech_ms: int = VAD_MIN_SPEECH_MS,
+        pre_roll_ms: int = VAD_PRE_ROLL_MS,
+        max_utterance_s: float = VAD_MAX_UTTERANCE_S,
+    ):
+        self.frame_size = sample_rate * frame_ms // 1000
+        self.energy_threshold = energy_threshold
+        self.noise_ratio = noise_ratio
+        self.min_silence_frames = max(1, min_silence_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.max_frames = max(1, int(max_utterance_s * 1000) // frame_ms)
+
+        self.noise_floor = energy_threshold / noise_ratio
+        self._pending = np.zeros(0, dtype=np.float32)  # samples short of a full frame
+        self._pre_roll = deque(maxlen=max(0, pre_roll_ms // frame_ms))
+        self._frames: List[np.ndarray] = []
+        self._speech_frames = 0
+        self._silence_run = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return bool(self._frames)
+
+    def push(self, samples: np.ndarray) -> List[np.ndarray]:
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+
+        n_frames = len(samples) // self.frame_size
+        self._pending = samples[n_frames * self.frame_size:].copy()
+        if not n_frames:
+            return []
+
+        frames = samples[:n_frames * self.frame_size].reshape(n_frames, self.frame_size)
+        energies = np.sqrt(np.mean(frames * frames, axis=1))
+
+        closed = []
+        for frame, energy in zip(frames, energies.tolist()):
+            is_speech = energy >= max(self.energy_threshold, self.noise_floor * self.noise_ratio)
+            if not is_speech:
+                # Track the background level (slowly, so trailing speech does not inflate it)
+                self.noise_floor = 0.95 * self.noise_floor + 0.05 * energy
+
+            if not self._frames:
+                if is_speech:
+                    self._frames = list(self._pre_roll) + [frame]
+                    self._pre_roll.clear()
+                    self._speech_frames, self._silence_run = 1, 0
+                else:
+                    self._pre_roll.append(frame)
+                continue
+
+            self._frames.append(frame)
+            if is_speech:
+                self._speech_frames += 1
+                self._silence_run = 0
+            else:
+                self._silence_run += 1
+
+            if self._silence_run >= self.min_silence_frames or len(self._frames) >= self.max_frames:
+                utterance = self._close()
+                if utterance is not None:
+                    closed.append(utterance)
+        return closed
+
+    def flush(self) -> Optional[np.ndarray]:
+        """Close the open utterance at end of stream (None if there is no speech)"""
+        if self._frames and len(self._pending):
+            self._frames.append(self._pending)
+        self._pending = np.zeros(0, dtype=np.float32)
+        return self._close()
+
+    def _close(self) -> Optional[np.ndarray]:
+        frames, speech = self._frames, self._speech_frames
+        self._frames, self._speech_frames, self._silence_run = [], 0, 0
+        if speech < self.min_speech_frames:
+            return None
+        return np.concatenate(frames)
+
+
+class StreamingTranscriber:
+    """
+    VAD-segmented, incremental transcription of one answer.
+    Segments are decoded on a worker thread in arrival order.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray, str], str],
+        sample_rate: int = 16000,
+        vad: Optional[EnergyVAD] = None,
+        on_segment: Optional[Callable[[str], None]] = None,
+        source=None,
+    ):
+        """
+        Args:
+            transcribe: (utterance_audio, transcript_so_far) -> text
+            sample_rate: Sample rate of the fed audio
+            vad: Voice-activity detector (default EnergyVAD with module settings)
+            on_segment: Called with each transcribed segment (more via subscribe())
+            source: RingReader to pull audio from (None = audio is pushed with feed())
+        """
+        self.transcribe = transcribe
+        self.sample_rate = sample_rate
+        self.vad = vad or EnergyVAD(sample_rate)
+        self.source = source
+
+        self.segments: List[str] = []
+        self.samples_fed = 0
+        self.stats = {"utterances": 0, "audio_s": 0.0, "decode_s": 0.0, "tail_decode_s": 0.0}
+        self.error: Optional[BaseException] = None
+        self.fallback_audio: Optional[np.ndarray] = None  # whole recording, kept only when incomplete
+
+        self._fed: List[np.ndarray] = []  # feed() blocks, for snapshot()
+        self._blocks: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        self._subscribers: List[Callable[[str], None]] = [on_segment] if on_segment else []
+        self._lock = threading.Lock()
+        self._deliver = threading.Lock()  # keeps replayed and live segments in order
+        self._finished = False
+        self._worker = threading.Thread(target=self._run, name="stt-stream", daemon=True)
+        self._worker.start()
+
+    def __len__(self) -> int:
+        """Samples recorded so far (like len() of a full clip)"""
+        return len(self.source) if self.source is not None else self.samples_fed
+
+    @property
+    def incomplete(self) -> bool:
+        """True if the transcript cannot stand for the answer (no utterance detected, or the worker failed)"""
+        return self.error is not None or self.stats["utterances"] == 0
+
+    @property
+    def transcript(self) -> str:
+        with self._lock:
+            return " ".join(self.segments).strip()
+
+    def feed(self, block: np.ndarray):
+        """Audio callback entry point: copy the block and return immediately"""
+        samples = np.array(block, dtype=np.float32, copy=True).reshape(-1)
+        self.samples_fed += len(samples)
+        self._fed.append(samples)
+        self._blocks.put(samples)
+
+    def snapshot(self) -> np.ndarray:
+        """The whole recording so far as one float32 array (a copy)"""
+        if self.source is not None:
+            return np.array(self.source.snapshot(), dtype=np.float32, copy=True)
+        return np.concatenate(self._fed) if self._fed else np.zeros(0, dtype=np.float32)
+
+    def subscribe(self, callback: Callable[[str], None]):
+        """Receive every segment: those already decoded now, the rest as they arrive"""
+        with self._deliver:
+            with self._lock:
+                done = list(self.segments)
+                self._subscribers.append(callback)
+            for text in done:
+                callback(text)
+
+    def finish(self):
+        """End of audio: the open utterance is flushed and decoded"""
+        if not self._finished:
+            self._finished = True
+            if self.source is not None:
+                self.source.close()
+            else:
+                self._blocks.put(None)
+
+    def result(self, on_segment: Optional[Callable[[str], None]] = None, timeout: Optional[float] = None) -> str:
+        """Finish, wait for the last segment and return the full transcript"""
+        if on_segment is not None:
+            self.subscribe(on_segment)
+        self.finish()
+        self._worker.join(timeout)
+        if self.error is not None:
+            print(f"   [STT] Streaming transcription failed: {self.error}")
+        return self.transcript
+
+    def _next_block(self) -> Optional[np.ndarray]:
+        """Next audio block; None at end of stream"""
+        if self.source is None:
+            return self._blocks.get()
+        while True:
+            block = self.source.read(timeout=SOURCE_POLL_S)
+            if len(block):
+                return block
+            if self.source.exhausted:
+                return None
+
+    def _run(self):
+        try:
+            while True:
+                block = self._next_block()
+                if block is None:
+                    tail = self.vad.flush()
+                    if tail is not None:
+                        start = time.time()
+                        self._decode(tail)
+                        self.stats["tail_decode_s"] = time.time() - start
+                    return
+                for utterance in self.vad.push(block):
+                    self._decode(utterance)
+        except Exception as e:
+            self.error = e
+        finally:
+            if self.incomplete:
+                # Keep the recording for a full-clip decode before the ring moves on to the next answer
+                self.fallback_audio = self.snapshot()
+
+    def _decode(self, utterance: np.ndarray):
+        start = time.time()
+        text = (self.transcribe(utterance, self.transcript) or "").strip()
+        self.stats["utterances"] += 1
+        self.stats["audio_s"] += len(utterance) / self.sample_rate
+        self.stats["decode_s"] += time.time() - start
+        if not text:
+            return
+        with self._deliver:
+            with self._lock:
+                self.segments.append(text)
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                try:
+                    callback(text)
+                except Exception as e:
+                    # A failing subscriber (e.g. the scorer) must not stop the transcription
+                    print(f"   [STT] Segment callback failed: {e}")
@@ -0,0 +1,4 @@
+# Embeddings Package
+from .engine import EmbeddingEngine, get_embedding_engine, read_pooling_pipeline, EMBEDDING_MODEL_NAME
+from .index import EmbeddingIndex, content_hash
+from .cache import EmbeddingCache
@@ -0,0 +1,112 @@
+"""
+Embedding Cache Module
+Bounded, thread-safe LRU + TTL cache of sentence embeddings.
+
+Candidates repeat stock phrases ("I don't know", "skip") and reports re-score the
+same answers, so the engine checks this cache before calling the model.
+Bounded by entry count AND bytes; entries also expire after a TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU cache: normalized text -> embedding vector (float32 numpy array).
+
+    Counters (hits, misses, evictions, expirations) are exposed via stats().
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 3600.0):
+        """
+        Args:
+            max_entries: Maximum number of cached texts
+            max_bytes: Maximum bytes of cached vectors + keys
+            ttl_seconds: Entry lifetime (<= 0 disables expiry)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl_seconds = float(ttl_seconds)
+
+        self._lock = threading.Lock()
+        # key -> (vector, expires_at, size_bytes); most recently used at the end
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, float, int]]" = OrderedDict()
+        self._bytes = 0
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def normalize_key(text: str, lowercase: bool = True) -> str:
+        """Collapse whitespace (and case, for uncased models) so trivial variants share an entry"""
+        key = " ".join(text.split())
+        return key.lower() if lowercase else key
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            vector, expires_at, size = entry
+            if self.ttl_seconds > 0 and time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: str, vector: np.ndarray):
+        vector = np.array(vector, dtype=np.float32)  # own copy, never a view into a batch
+        vector.flags.writeable = False
+        size = vector.nbytes + len(key)
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+            self._entries[key] = (vector, expires_at, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
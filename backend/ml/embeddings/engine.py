@@ -0,0 +1,249 @@
+"""
+Embedding Engine Module
+Process-wide owner of the SentenceTransformer used by IntentPredictor and AnswerEvaluator.
+
+Both classes used to load their own copy of 'all-MiniLM-L6-v2'. The registry below
+loads each model ONCE per process and hands the same engine to every caller.
+
+Import it as `ml.embeddings` (backend/ on sys.path) so there is a single registry.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
+
+from utils.stage_timing import stage
+
+from .cache import EmbeddingCache
+
+# ==================== CONFIG ====================
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Inference backend: "torch" (default), "onnx" or "onnx-int8" (CPU, ONNX Runtime)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+# Embedding cache (EMBEDDING_CACHE_SIZE=0 disables it)
+CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_SIZE", 4096))
+CACHE_MAX_MB = float(os.getenv("EMBEDDING_CACHE_MAX_MB", 64))
+CACHE_TTL_SECONDS = float(os.getenv("EMBEDDING_CACHE_TTL", 3600))
+
+
+def read_pooling_pipeline(st_model) -> Tuple[str, bool]:
+    """
+    Pooling mode ("mean" or "cls") and normalize flag of a SentenceTransformer,
+    for inference paths that re-implement its post-processing (ONNX, fused graph).
+    Raises ValueError for pipelines they cannot reproduce.
+    """
+    pooling_mode = None
+    normalize = False
+    for module in st_model:
+        name = type(module).__name__
+        if name == "Pooling":
+            config = module.get_config_dict()
+            # sentence-transformers 3.x/4.x use boolean flags, 5.x a single "pooling_mode"
+            if config.get("pooling_mode_mean_tokens") or config.get("pooling_mode") == "mean":
+                pooling_mode = "mean"
+            elif config.get("pooling_mode_cls_token") or config.get("pooling_mode") == "cls":
+                pooling_mode = "cls"
+            else:
+                raise ValueError(f"Unsupported pooling config: {config}")
+        elif name == "Normalize":
+            normalize = True
+        elif name != "Transformer":
+            raise ValueError(f"Unsupported SentenceTransformer module: {name}")
+    if pooling_mode is None:
+        raise ValueError("SentenceTransformer has no Pooling module")
+    return pooling_mode, normalize
+
+
+class EmbeddingEngine:
+    """
+    Shared sentence embedding model.
+    Owns the weights and exposes batched encoding.
+    """
+
+    def __init__(
+        self,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        device: Optional[str] = None,
+        cache: Optional[EmbeddingCache] = None,
+        backend: str = "torch",
+    ):
+        """
+        Load the embedding model.
+
+        Args:
+            model_name: SentenceTransformer model name or path
+            device: 'cuda' or 'cpu' (auto-detected if None)
+            cache: Embedding cache consulted before every encode (None = no cache)
+            backend: "torch", "onnx" or "onnx-int8" (falls back to torch on failure)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown embedding backend '{backend}', expected one of {BACKENDS}")
+        self.model_name = model_name
+
+        print(f"[EMBEDDING] Loading shared embedding model: {model_name}")
+        start = time.perf_counter()
+        self.model = SentenceTransformer(model_name, device=device)
+        self.load_seconds = time.perf_counter() - start
+
+        self.device = str(self.model.device)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+        self.cache = cache
+        self.backend = "torch"
+        self.onnx_encoder = None
+        self.parity = None
+        if backend != "torch":
+            self._init_onnx(quantize=(backend == "onnx-int8"))
+        # Uncased tokenizers (MiniLM) map "Skip" and "skip" to the same tokens
+        self._cache_lowercase = bool(getattr(self.model.tokenizer, "do_lower_case", False))
+        print(f"[EMBEDDING] Ready on {self.device} ({self.load_seconds:.2f}s, "
+              f"{self.memory_footprint()['total_mb']:.1f} MB)")
+
+    def encode(
+        self,
+        texts: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_tensor: bool = False,
+        normalize: bool = False,
+    ):
+        """
+        Encode one text or a batch of texts in a single model call.
+
+        Args:
+            texts: A string or list of strings
+            batch_size: Internal encode batch size
+            convert_to_tensor: Return a torch tensor instead of a numpy array
+            normalize: L2-normalize embeddings (dot product == cosine similarity)
+
+        Returns:
+            Embeddings with the same leading shape as the input
+        """
+        if self.cache is None and self.onnx_encoder is None:
+            with stage("embedding", "encode"):
+                return self.model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    convert_to_tensor=convert_to_tensor,
+                    normalize_embeddings=normalize,
+                    show_progress_bar=False,
+                )
+
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        embeddings = np.empty((len(batch), self.dimension), dtype=np.float32)
+
+        if self.cache is None:
+            if batch:
+                embeddings[:] = self._encode_uncached(batch, batch_size)
+        else:
+            # Cache lookups; misses are grouped by key so duplicates encode once
+            missing: Dict[str, List[int]] = {}
+            with stage("embedding", "cache_lookup"):
+                for i, text in enumerate(batch):
+                    key = EmbeddingCache.normalize_key(text, self._cache_lowercase)
+                    vector = self.cache.get(key)
+                    if vector is None:
+                        missing.setdefault(key, []).append(i)
+                    else:
+                        embeddings[i] = vector
+
+            if missing:
+                keys = list(missing)
+                encoded = self._encode_uncached([batch[missing[key][0]] for key in keys], batch_size)
+                for key, vector in zip(keys, encoded):
+                    self.cache.put(key, vector)
+                    embeddings[missing[key]] = vector
+
+        if normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, 1e-12)
+
+        if single:
+            embeddings = embeddings[0]
+        if convert_to_tensor:
+            return torch.from_numpy(embeddings).to(self.device)
+        return embeddings
+
+    def _encode_uncached(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """Raw model call on the selected backend (numpy float32 [N, dim])"""
+        with stage("embedding", "encode"):
+            if self.onnx_encoder is not None:
+                return self.onnx_encoder.encode(texts, batch_size=batch_size)
+            return self.model.encode(texts, batch_size=batch_size, show_progress_bar=False)
+
+    def _init_onnx(self, quantize: bool):
+        """Switch encoding to ONNX Runtime if export and the parity check succeed"""
+        from .onnx_backend import OnnxEncoder, check_parity
+
+        label = "onnx-int8" if quantize else "onnx"
+        try:
+            encoder = OnnxEncoder(self.model, self.model_name, quantize=quantize)
+            self.parity = check_parity(self.model, encoder)
+        except (ImportError, ValueError, RuntimeError, OSError) as e:  # ParityError is a ValueError
+            print(f"[EMBEDDING] ⚠️ {label} backend unavailable, using torch: {e}")
+            return
+
+        self.onnx_encoder = encoder
+        self.backend = label
+        print(f"[EMBEDDING] Using {label} backend (parity: {self.parity})")
+
+    def memory_footprint(self) -> Dict[str, float]:
+        """Bytes held by the model weights and buffers"""
+        param_bytes = sum(p.numel() * p.element_size() for p in self.model.parameters())
+        buffer_bytes = sum(b.numel() * b.element_size() for b in self.model.buffers())
+        return {
+            "parameters_bytes": param_bytes,
+            "buffers_bytes": buffer_bytes,
+            "total_mb": (param_bytes + buffer_bytes) / (1024 * 1024),
+        }
+
+    def info(self) -> Dict[str, object]:
+        """Metadata for diagnostics endpoints"""
+        return {
+            "model": self.model_name,
+            "device": self.device,
+            "dimension": self.dimension,
+            "backend": self.backend,
+            "parity": self.parity,
+            "load_seconds": round(self.load_seconds, 3),
+            "memory": self.memory_footprint(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+
+# ==================== REGISTRY ====================
+_engines: Dict[str, EmbeddingEngine] = {}
+_registry_lock = threading.Lock()
+
+
+def get_embedding_engine(model_name: str = EMBEDDING_MODEL_NAME, device: Optional[str] = None) -> EmbeddingEngine:
+    """
+    Get the process-wide engine for a model (loaded on first use).
+
+    `device` only applies to the call that actually loads the model.
+    """
+    engine = _engines.get(model_name)
+    if engine is not None:
+        return engine
+
+    with _registry_lock:
+        engine = _engines.get(model_name)
+        if engine is None:
+            cache = None
+            if CACHE_MAX_ENTRIES > 0:
+                cache = EmbeddingCache(
+                    max_entries=CACHE_MAX_ENTRIES,
+                    max_bytes=int(CACHE_MAX_MB * 1024 * 1024),
+                    ttl_seconds=CACHE_TTL_SECONDS,
+                )
+            engine = EmbeddingEngine(model_name, device=device, cache=cache, backend=EMBEDDING_BACKEND)
+            _engines[model_name] = engine
+    return engine
@@ -0,0 +1,206 @@
+"""
+Embedding Index Module
+On-disk store of pre-encoded, L2-normalized embeddings.
+
+Layout (one set of files per index name):
+    <INDEX_DIR>/<name>.npy       float32 matrix [N, dim], memory-mapped on load
+    <INDEX_DIR>/<name>.keys.npy  sorted SHA-1 digests of the row texts, memory-mapped
+    <INDEX_DIR>/<name>.rows.npy  matrix row of each sorted digest, memory-mapped
+    <INDEX_DIR>/<name>.json      manifest: model, dimension, fingerprint, row count
+
+An index is keyed either
+  - by text: the fingerprint covers the model name and every indexed text, so
+    the index is rebuilt automatically when the source texts change, or
+  - by source row (source_fingerprint=...): row i is row i of the source (e.g.
+    a QuestionStore) and the fingerprint is the model name plus the source's
+    own fingerprint, so loading never reads or hashes a single text.
+
+lookup() binary-searches the memory-mapped digests; no per-text table is held.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+# ==================== CONFIG ====================
+INDEX_DIR = os.getenv(
+    "EMBEDDING_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models", "saved", "embedding_index")
+)
+
+
+def content_hash(text: str) -> str:
+    """Stable key for a text (exact content, UTF-8)"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _sorted_keys(keys: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """(sorted digests, matrix row of each) - hex digests, so no NUL padding issues"""
+    digests = np.array(keys, dtype="S40").reshape(-1)
+    order = np.argsort(digests, kind="stable").astype(np.int64)
+    return digests[order], order
+
+
+class EmbeddingIndex:
+    """
+    Memory-mapped lookup table: text (or source row) -> normalized embedding.
+
+    Usage:
+        index = EmbeddingIndex("expected_answers").build_or_load(engine, texts)
+        vec = index.lookup("JDK is for development, ...")  # None if not indexed
+
+        # One row per store row, loaded without decoding the store
+        index = EmbeddingIndex("questions").build_or_load(
+            engine, lambda: [q for q, _ in store.iter_rows()], source_fingerprint=store.fingerprint)
+        vec = index.matrix[row]
+    """
+
+    def __init__(self, name: str, index_dir: str = INDEX_DIR):
+        self.name = name
+        self.index_dir = os.path.abspath(index_dir)
+        self.matrix_path = os.path.join(self.index_dir, f"{name}.npy")
+        self.keys_path = os.path.join(self.index_dir, f"{name}.keys.npy")
+        self.rows_path = os.path.join(self.index_dir, f"{name}.rows.npy")
+        self.manifest_path = os.path.join(self.index_dir, f"{name}.json")
+
+        self.matrix: Optional[np.ndarray] = None
+        self.fingerprint: Optional[str] = None
+        self._keys: Optional[np.ndarray] = None       # sorted digests
+        self._key_rows: Optional[np.ndarray] = None   # matrix row per digest
+
+    def __len__(self) -> int:
+        return 0 if self.matrix is None else len(self.matrix)
+
+    def __contains__(self, text: str) -> bool:
+        return self._find(text) is not None
+
+    @staticmethod
+    def compute_fingerprint(model_name: str, keys: Iterable[str]) -> str:
+        digest = hashlib.sha256(model_name.encode("utf-8"))
+        for key in sorted(set(keys)):
+            digest.update(key.encode("ascii"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def source_fingerprint(model_name: str, source_fingerprint: str) -> str:
+        return hashlib.sha256(f"{model_name}\x00rows\x00{source_fingerprint}".encode("utf-8")).hexdigest()
+
+    def build_or_load(
+        self,
+        engine,
+        texts: Union[Iterable[str], Callable[[], Iterable[str]]],
+        source_fingerprint: Optional[str] = None,
+    ) -> "EmbeddingIndex":
+        """
+        Load the on-disk index if it matches the source and the engine's model,
+        otherwise encode everything once and write a fresh index.
+
+        Args:
+            engine: EmbeddingEngine used to (re)build
+            texts: Texts to index - with source_fingerprint, one text per source
+                   row in row order, or a callable returning them (only called
+                   when the index has to be rebuilt)
+            source_fingerprint: Fingerprint of the row source; keys the index by
+                                row instead of by text
+        """
+        if source_fingerprint is None:
+            texts = list(dict.fromkeys(texts() if callable(texts) else texts))
+            keys = [content_hash(t) for t in texts]
+            fingerprint = self.compute_fingerprint(engine.model_name, keys)
+        else:
+            keys = None
+            fingerprint = self.source_fingerprint(engine.model_name, source_fingerprint)
+
+        if self._load(fingerprint):
+            print(f"[INDEX] Loaded '{self.name}' ({len(self)} vectors, memory-mapped)")
+            return self
+
+        if keys is None:
+            texts = list(texts() if callable(texts) else texts)
+            keys = [content_hash(t) for t in texts]
+
+        print(f"[INDEX] Building '{self.name}' ({len(texts)} texts)...")
+        embeddings = engine.encode(texts, normalize=True) if texts else \
+            np.zeros((0, engine.dimension), dtype=np.float32)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        try:
+            self._save(embeddings, keys, fingerprint, engine)
+        except OSError as e:
+            # e.g. read-only deployment or file locked by another process (Windows)
+            print(f"[INDEX] Could not save '{self.name}' ({e}); keeping it in memory")
+
+        if self._load(fingerprint):
+            print(f"[INDEX] Saved '{self.name}' to {self.matrix_path}")
+        else:
+            self.matrix = embeddings
+            self.fingerprint = fingerprint
+            self._keys, self._key_rows = _sorted_keys(keys)
+        return self
+
+    def lookup(self, text: str) -> Optional[np.ndarray]:
+        """Normalized embedding for `text`, or None if it is not indexed"""
+        row = self._find(text)
+        if row is None:
+            return None
+        return self.matrix[row]
+
+    def _find(self, text: str) -> Optional[int]:
+        if self._keys is None or not len(self._keys):
+            return None
+        key = content_hash(text).encode("ascii")
+        i = int(np.searchsorted(self._keys, key))
+        if i < len(self._keys) and self._keys[i] == key:
+            return int(self._key_rows[i])
+        return None
+
+    def _load(self, fingerprint: str) -> bool:
+        paths = (self.manifest_path, self.matrix_path, self.keys_path, self.rows_path)
+        if not all(os.path.exists(p) for p in paths):
+            return False
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("fingerprint") != fingerprint:
+                print(f"[INDEX] '{self.name}' is stale (source texts or model changed)")
+                return False
+
+            matrix = np.load(self.matrix_path, mmap_mode="r")
+            keys = np.load(self.keys_path, mmap_mode="r")
+            key_rows = np.load(self.rows_path, mmap_mode="r")
+            n_rows = manifest["rows"]
+            if matrix.shape != (n_rows, manifest["dimension"]) or keys.shape != key_rows.shape:
+                return False
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[INDEX] Could not read '{self.name}': {e}")
+            return False
+
+        self.matrix = matrix
+        self.fingerprint = fingerprint
+        self._keys = keys
+        self._key_rows = key_rows
+        return True
+
+    def _save(self, embeddings: np.ndarray, keys: List[str], fingerprint: str, engine):
+        os.makedirs(self.index_dir, exist_ok=True)
+        sorted_keys, key_rows = _sorted_keys(keys)
+
+        # Write to temp files first so a concurrent reader never sees half an index;
+        # the manifest goes last, it is what marks the index as current
+        tmp = f".{os.getpid()}.tmp"
+        for path, array in ((self.matrix_path, embeddings), (self.keys_path, sorted_keys), (self.rows_path, key_rows)):
+            with open(path + tmp, "wb") as f:
+                np.save(f, array)
+        with open(self.manifest_path + tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "model": engine.model_name,
+                "dimension": int(embeddings.shape[1]) if embeddings.ndim == 2 else engine.dimension,
+                "fingerprint": fingerprint,
+                "rows": int(len(embeddings)),
+            }, f)
+
+        for path in (self.matrix_path, self.keys_path, self.rows_path, self.manifest_path):
+            os.replace(path + tmp, path)
@@ -0,0 +1,233 @@
+"""
+ONNX Runtime Backend Module
+CPU inference path for the SentenceTransformer encoder.
+
+The transformer is exported to ONNX once (optionally dynamic INT8 quantized) and
+run through ONNX Runtime. Tokenization reuses the SentenceTransformer tokenizer;
+pooling and normalization are done in numpy to match the original pipeline
+(all-MiniLM-L6-v2: Transformer -> mean Pooling -> Normalize).
+
+Optional dependencies: onnxruntime (inference) and onnx (export).
+
+Usage (export + parity check from backend/):
+    python -m ml.embeddings.onnx_backend --quantize
+"""
+
+import copy
+import inspect
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+from utils.stage_timing import stage
+
+from .engine import read_pooling_pipeline
+
+# ==================== CONFIG ====================
+ONNX_DIR = os.getenv(
+    "EMBEDDING_ONNX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models", "saved", "onnx")
+)
+ONNX_OPSET = 14
+
+# Max allowed |cosine(torch) - cosine(onnx)| between text pairs.
+# 0.02 == two points on the 0-100 answer score.
+PARITY_TOLERANCE = float(os.getenv("ONNX_PARITY_TOLERANCE", 0.02))
+
+PARITY_SAMPLE_TEXTS = [
+    "JDK is for development, JRE for running, JVM executes bytecode.",
+    "i dunno much about javascript async await stuff",
+    "Lists are mutable, tuples are immutable.",
+    "SELECT * FROM users WHERE id = 1",
+    "neural networks with backpropagation",
+    "skip",
+]
+
+
+class OnnxEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode (numpy output) backed by ONNX Runtime.
+    """
+
+    def __init__(self, st_model, model_name: str, quantize: bool = False, onnx_dir: str = ONNX_DIR):
+        """
+        Args:
+            st_model: Loaded SentenceTransformer (source of weights, tokenizer, pooling config)
+            model_name: Used to name the exported files
+            quantize: Apply dynamic INT8 quantization to the exported graph
+            onnx_dir: Where exported graphs are cached
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError("ONNX backend requires 'onnxruntime' (pip install onnxruntime)") from e
+
+        self.tokenizer = st_model.tokenizer
+        self.max_seq_length = st_model.max_seq_length
+        self.quantize = quantize
+        self.pooling_mode, self.normalize = read_pooling_pipeline(st_model)
+
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+        self.fp32_path = os.path.join(os.path.abspath(onnx_dir), f"{safe_name}.onnx")
+        self.int8_path = os.path.join(os.path.abspath(onnx_dir), f"{safe_name}.int8.onnx")
+
+        self.input_names = list(self.tokenizer("warmup", return_tensors="np").keys())
+        if not os.path.exists(self.fp32_path):
+            self._export(st_model)
+        if quantize and not os.path.exists(self.int8_path):
+            self._quantize()
+
+        self.model_path = self.int8_path if quantize else self.fp32_path
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(self.model_path, options, providers=["CPUExecutionProvider"])
+        print(f"[ONNX] Session ready: {os.path.basename(self.model_path)}")
+
+    def _export(self, st_model):
+        os.makedirs(os.path.dirname(self.fp32_path), exist_ok=True)
+        transformer = st_model[0].auto_model
+        if next(transformer.parameters()).device.type != "cpu":
+            # Export from a CPU copy; the shared model stays on its device
+            transformer = copy.deepcopy(transformer).to("cpu")
+        transformer.eval()
+
+        sample = self.tokenizer(["export sample text"], return_tensors="pt")
+        args = tuple(sample[name] for name in self.input_names)
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in self.input_names}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+        kwargs = {}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+            kwargs["dynamo"] = False  # TorchScript exporter: stable dynamic_axes support
+
+        print(f"[ONNX] Exporting transformer to {self.fp32_path}...")
+        tmp_path = self.fp32_path + f".{os.getpid()}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                _LastHiddenState(transformer, self.input_names),
+                args,
+                tmp_path,
+                input_names=self.input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=ONNX_OPSET,
+                **kwargs,
+            )
+        os.replace(tmp_path, self.fp32_path)
+
+    def _quantize(self):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        print(f"[ONNX] Quantizing (dynamic INT8) to {self.int8_path}...")
+        tmp_path = self.int8_path + f".{os.getpid()}.tmp"
+        quantize_dynamic(self.fp32_path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, self.int8_path)
+
+    def encode(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """Embeddings for a list of texts, float32 [N, dim]"""
+        outputs = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            with stage("embedding", "tokenize"):
+                tokens = self.tokenizer(
+                    chunk,
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_seq_length,
+                    return_tensors="np",
+                )
+                feeds = {name: tokens[name].astype(np.int64) for name in self.input_names}
+            with stage("embedding", "onnx_run"):
+                hidden = self.session.run(["last_hidden_state"], feeds)[0]
+                outputs.append(self._pool(hidden, feeds["attention_mask"]))
+
+        if not outputs:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.concatenate(outputs, axis=0)
+
+    def _pool(self, hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        if self.pooling_mode == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = attention_mask[..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+
+        if self.normalize:
+            pooled = pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+        return pooled.astype(np.float32)
+
+
+class _LastHiddenState(torch.nn.Module):
+    """Positional-argument wrapper so the exported graph has one named output"""
+
+    def __init__(self, transformer, input_names: List[str]):
+        super().__init__()
+        self.transformer = transformer
+        self.input_names = input_names
+
+    def forward(self, *inputs):
+        return self.transformer(**dict(zip(self.input_names, inputs)))[0]
+
+
+# ==================== PARITY CHECK ====================
+def parity_report(st_model, encoder: OnnxEncoder, texts: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Compare the ONNX path against the PyTorch path on sample texts.
+
+    Returns:
+        max_embedding_diff: largest element-wise embedding difference
+        max_score_diff: largest |cosine similarity difference| over all text pairs
+    """
+    texts = texts or PARITY_SAMPLE_TEXTS
+    reference = st_model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+    candidate = encoder.encode(texts)
+    candidate = candidate / np.maximum(np.linalg.norm(candidate, axis=1, keepdims=True), 1e-12)
+
+    return {
+        "max_embedding_diff": float(np.abs(reference - candidate).max()),
+        "max_score_diff": float(np.abs(reference @ reference.T - candidate @ candidate.T).max()),
+    }
+
+
+class ParityError(ValueError):
+    """ONNX similarity scores drifted beyond the tolerance; `report` holds the measured diffs"""
+
+    def __init__(self, message: str, report: Dict[str, float]):
+        super().__init__(message)
+        self.report = report
+
+
+def check_parity(st_model, encoder: OnnxEncoder, tolerance: float = PARITY_TOLERANCE,
+                 texts: Optional[List[str]] = None) -> Dict[str, float]:
+    """Raise ParityError if ONNX similarity scores drift beyond `tolerance` (also under python -O)"""
+    report = parity_report(st_model, encoder, texts)
+    if not report["max_score_diff"] <= tolerance:  # also rejects NaN
+        raise ParityError(
+            f"ONNX backend drifted from PyTorch: max score diff {report['max_score_diff']:.4f} "
+            f"> tolerance {tolerance} ({report})",
+            report,
+        )
+    return report
+
+
+# ==================== MAIN (Export + Parity) ====================
+if __name__ == "__main__":
+    import argparse
+
+    from sentence_transformers import SentenceTransformer
+
+    from .engine import EMBEDDING_MODEL_NAME
+
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX and check parity")
+    parser.add_argument("--model", default=EMBEDDING_MODEL_NAME)
+    parser.add_argument("--quantize", action="store_true", help="Also build the dynamic INT8 graph")
+    parser.add_argument("--tolerance", type=float, default=PARITY_TOLERANCE)
+    args = parser.parse_args()
+
+    st_model = SentenceTransformer(args.model, device="cpu")
+    encoder = OnnxEncoder(st_model, args.model, quantize=args.quantize)
+    report = check_parity(st_model, encoder, args.tolerance)
+    print(f"✅ Parity OK: {report}")
@@ -0,0 +1,65 @@
+"""
+Fused Intent Model - Transformer + Pooling + Normalize + IntentClassifier in ONE graph
+Inference-only wrapper used by IntentPredictor's "fused" mode.
+
+Standard path:  tokens -> SentenceTransformer.encode -> numpy -> torch.tensor(...)
+                -> IntentClassifier -> sigmoid
+Fused path:     tokens -> traced TorchScript graph -> probabilities
+
+The traced graph shares its parameters with the original modules (no weight copy).
+"""
+
+from typing import List
+
+import torch
+import torch.nn as nn
+
+
+class FusedIntentModel(nn.Module):
+    """
+    Sentence encoder and intent head as a single module.
+
+    Input:  tokenizer outputs (input_ids, attention_mask[, token_type_ids]) as positional tensors
+    Output: topic probabilities of shape (batch_size, output_dim)
+    """
+
+    def __init__(
+        self,
+        transformer: nn.Module,
+        classifier: nn.Module,
+        input_names: List[str],
+        pooling_mode: str = "mean",
+        normalize: bool = True
+    ):
+        super(FusedIntentModel, self).__init__()
+        self.transformer = transformer
+        self.classifier = classifier
+        self.input_names = list(input_names)
+        self.mask_index = self.input_names.index("attention_mask")
+        self.pooling_mode = pooling_mode
+        self.normalize = normalize
+
+    def forward(self, *inputs: torch.Tensor) -> torch.Tensor:
+        hidden = self.transformer(**dict(zip(self.input_names, inputs)))[0]
+
+        # Pooling (same as sentence_transformers.models.Pooling)
+        if self.pooling_mode == "cls":
+            pooled = hidden[:, 0]
+        else:
+            mask = inputs[self.mask_index].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+
+        if self.normalize:
+            pooled = nn.functional.normalize(pooled, p=2, dim=1)
+
+        return torch.sigmoid(self.classifier(pooled))
+
+
+def trace_fused_model(fused: FusedIntentModel, example_inputs: tuple) -> torch.jit.ScriptModule:
+    """
+    Trace the fused module into a single TorchScript graph.
+    Not frozen on purpose: freezing would copy the encoder weights into graph constants.
+    """
+    fused.eval()
+    with torch.no_grad():
+        return torch.jit.trace(fused, example_inputs, strict=False, check_trace=False)
@@ -7,19 +7,32 @@ import os
 import sys
 import torch
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add backend directory to path (shared embedding engine)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from models.intent_classifier import IntentClassifier
+from ml.embeddings import get_embedding_engine, read_pooling_pipeline
+from utils.stage_timing import stage
 
 # ==================== CONFIG ====================
 MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "models", "saved")
 MODEL_PATH = os.path.join(MODELS_DIR, "intent_model.pth")
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
 
+# "standard": SentenceTransformer.encode -> numpy -> IntentClassifier
+# "fused":    one traced TorchScript graph (encoder + pooling + normalize + head)
+INFERENCE_MODE = os.getenv("INTENT_INFERENCE_MODE", "standard").lower()
+FUSED_PARITY_TOLERANCE = 1e-3
+FUSED_PARITY_TEXTS = [
+    "I work with React hooks and useState",
+    "SELECT * FROM users WHERE id = 1",
+    "i dunno much about javascript async await stuff",
+]
+
 
 class IntentPredictor:
     """
@@ -27,13 +40,14 @@ class IntentPredictor:
     Handles text embedding and topic prediction.
     """
     
-    def __init__(self, model_path: str = MODEL_PATH, device: str = None):
+    def __init__(self, model_path: str = MODEL_PATH, device: str = None, inference_mode: str = INFERENCE_MODE):
         """
         Initialize the predictor with a trained model.
         
         Args:
             model_path: Path to saved model checkpoint
             device: 'cuda' or 'cpu' (auto-detected if None)
+            inference_mode: 'standard' or 'fused' (falls back to standard on failure)
         """
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
         
@@ -60,16 +74,90 @@ class IntentPredictor:
         self.model.to(self.device)
         self.model.eval()
         
-        # Load embedding model
-        print(f"[PREDICTOR] Loading embedding model: {EMBEDDING_MODEL_NAME}")
-        self.embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        # Shared embedding model (same instance as AnswerEvaluator)
+        print(f"[PREDICTOR] Using shared embedding model: {EMBEDDING_MODEL_NAME}")
+        self.embedding_engine = get_embedding_engine(EMBEDDING_MODEL_NAME)
+        self.embedding_model = self.embedding_engine.model
+        
+        self.inference_mode = "standard"
+        self.fused_model = None
+        if inference_mode == "fused":
+            self._init_fused()
         
-        print(f"[PREDICTOR] Model loaded successfully on {self.device}")
+        print(f"[PREDICTOR] Model loaded successfully on {self.device} ({self.inference_mode} mode)")
         print(f"[PREDICTOR] Labels: {self.label_names}")
     
+    def _init_fused(self):
+        """Trace encoder + head into one graph; keep the standard path if anything is off"""
+        from models.fused_intent_model import FusedIntentModel, trace_fused_model
+        
+        try:
+            if torch.device(self.embedding_engine.device).type != torch.device(self.device).type:
+                raise RuntimeError(
+                    f"encoder on {self.embedding_engine.device}, classifier on {self.device}"
+                )
+            if self.embedding_engine.backend != "torch":
+                raise RuntimeError(f"embedding backend is {self.embedding_engine.backend}, not torch")
+            
+            pooling_mode, normalize = read_pooling_pipeline(self.embedding_model)
+            self.tokenizer = self.embedding_model.tokenizer
+            self.max_seq_length = self.embedding_model.max_seq_length
+            self.input_names = list(self.tokenizer("warmup", return_tensors="pt").keys())
+            
+            fused = FusedIntentModel(
+                self.embedding_model[0].auto_model,
+                self.model,
+                self.input_names,
+                pooling_mode=pooling_mode,
+                normalize=normalize
+            )
+            self.fused_model = trace_fused_model(fused, self._tokenize(["fused graph warmup text"]))
+            
+            # Parity check against the standard path
+            standard = self._standard_probs(FUSED_PARITY_TEXTS)
+            fused_probs = self._probs(FUSED_PARITY_TEXTS)
+            drift = float(np.abs(standard - fused_probs).max())
+            if drift > FUSED_PARITY_TOLERANCE:
+                raise RuntimeError(f"fused graph drifted from standard path by {drift:.5f}")
+        except Exception as e:
+            print(f"[PREDICTOR] ⚠️ Fused mode unavailable, using standard: {e}")
+            self.fused_model = None
+            return
+        
+        self.inference_mode = "fused"
+    
+    def _tokenize(self, texts: List[str]) -> tuple:
+        with stage("intent", "tokenize"):
+            tokens = self.tokenizer(
+                list(texts),
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="pt"
+            )
+            return tuple(tokens[name].to(self.device) for name in self.input_names)
+    
+    def _standard_probs(self, texts: List[str]) -> np.ndarray:
+        """Encode (shared engine) -> IntentClassifier -> sigmoid"""
+        embeddings = self.embedding_engine.encode(list(texts))
+        
+        with stage("intent", "classify"), torch.no_grad():
+            embeddings = torch.from_numpy(np.asarray(embeddings, dtype=np.float32)).to(self.device)
+            return torch.sigmoid(self.model(embeddings)).cpu().numpy()
+    
+    def _probs(self, texts: List[str]) -> np.ndarray:
+        """Topic probabilities, shape (len(texts), num_labels)"""
+        if self.fused_model is None:
+            return self._standard_probs(texts)
+        
+        # Fused graph: tokens in, probabilities out (no numpy embedding round trip)
+        inputs = self._tokenize(texts)
+        with stage("intent", "fused_forward"), torch.inference_mode():
+            return self.fused_model(*inputs).cpu().numpy()
+    
     def encode_text(self, text: str) -> torch.Tensor:
         """Convert text to embedding vector"""
-        embedding = self.embedding_model.encode([text])
+        embedding = self.embedding_engine.encode([text])
         return torch.tensor(embedding, dtype=torch.float32).to(self.device)
     
     def predict_proba(self, text: str) -> Dict[str, float]:
@@ -79,14 +167,27 @@ class IntentPredictor:
         Returns:
             Dictionary mapping topic names to probabilities
         """
-        embedding = self.encode_text(text)
-        
-        with torch.no_grad():
-            logits = self.model(embedding)
-            probs = torch.sigmoid(logits).squeeze().cpu().numpy()
+        probs = self._probs([text])[0]
         
         return {label: float(prob) for label, prob in zip(self.label_names, probs)}
     
+    def predict_proba_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Get probability scores for many texts with a single encode + forward pass.
+        
+        Returns:
+            One topic -> probability dictionary per input text (same order)
+        """
+        if not texts:
+            return []
+        
+        probs = self._probs(texts)
+        
+        return [
+            {label: float(prob) for label, prob in zip(self.label_names, row)}
+            for row in probs
+        ]
+    
     def predict(self, text: str, threshold: float = 0.5) -> List[str]:
         """
         Predict topic labels for input text.
@@ -109,14 +210,58 @@ class IntentPredictor:
             List of (topic, probability) tuples, sorted by probability
         """
         probs = self.predict_proba(text)
-        results = [(label, prob) for label, prob in probs.items() if prob >= threshold]
-        return sorted(results, key=lambda x: x[1], reverse=True)
+        return self._thresholded_ranking(probs, threshold)
     
     def get_top_k(self, text: str, k: int = 3) -> List[Tuple[str, float]]:
         """Get top-k predictions regardless of threshold"""
         probs = self.predict_proba(text)
         sorted_probs = sorted(probs.items(), key=lambda x: x[1], reverse=True)
         return sorted_probs[:k]
+    
+    def predict_all(self, text: str, threshold: float = 0.5, k: int = 3) -> Dict[str, Any]:
+        """
+        Single-pass prediction: one embedding + one forward pass.
+        Equivalent to calling predict, predict_with_scores, predict_proba and
+        get_top_k on the same text, without re-encoding it each time.
+        
+        Returns:
+            {
+                "topics": predict() result,
+                "predictions": predict_with_scores() result,
+                "scores": predict_proba() result,
+                "top_k": get_top_k() result
+            }
+        """
+        return self._summarize(self.predict_proba(text), threshold, k)
+    
+    def predict_all_batch(self, items: List[Tuple[str, float]], k: int = 3) -> List[Dict[str, Any]]:
+        """
+        predict_all for many (text, threshold) pairs with one batched encode.
+        
+        Returns:
+            One predict_all() result per item (same order)
+        """
+        texts = [text for text, _ in items]
+        all_probs = self.predict_proba_batch(texts)
+        return [
+            self._summarize(probs, threshold, k)
+            for probs, (_, threshold) in zip(all_probs, items)
+        ]
+    
+    @staticmethod
+    def _thresholded_ranking(probs: Dict[str, float], threshold: float) -> List[Tuple[str, float]]:
+        results = [(label, prob) for label, prob in probs.items() if prob >= threshold]
+        return sorted(results, key=lambda x: x[1], reverse=True)
+    
+    @classmethod
+    def _summarize(cls, probs: Dict[str, float], threshold: float, k: int) -> Dict[str, Any]:
+        sorted_probs = sorted(probs.items(), key=lambda x: x[1], reverse=True)
+        return {
+            "topics": [label for label, prob in probs.items() if prob >= threshold],
+            "predictions": cls._thresholded_ranking(probs, threshold),
+            "scores": probs,
+            "top_k": sorted_probs[:k]
+        }
 
 
 # ==================== CONVENIENCE FUNCTION ====================
@@ -0,0 +1,53 @@
+"""
+Stage Timing Hook
+Lets a host process (e.g. ml-service metrics) observe how long each inference
+stage takes - tokenize, encode, similarity, classify - without the backend
+depending on any metrics library.
+
+    with stage("evaluator", "similarity"):
+        similarities = ...
+
+With no observer installed, stage() returns one shared no-op context manager,
+so instrumented code pays a function call and nothing else.
+"""
+
+import time
+from contextlib import nullcontext
+from typing import Callable, Optional
+
+# observer(component, stage, seconds)
+StageObserver = Callable[[str, str, float], None]
+
+_observer: Optional[StageObserver] = None
+_NOOP = nullcontext()
+
+
+def set_stage_observer(observer: Optional[StageObserver]):
+    """Install (or remove with None) the process-wide stage observer"""
+    global _observer
+    _observer = observer
+
+
+class _StageTimer:
+    __slots__ = ("component", "name", "observer", "start")
+
+    def __init__(self, component: str, name: str, observer: StageObserver):
+        self.component = component
+        self.name = name
+        self.observer = observer
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.observer(self.component, self.name, time.perf_counter() - self.start)
+        return False
+
+
+def stage(component: str, name: str):
+    """Context manager timing one stage of `component` (no-op without an observer)"""
+    observer = _observer
+    if observer is None:
+        return _NOOP
+    return _StageTimer(component, name, observer)
@@ -0,0 +1,218 @@
+"""
+Dynamic Micro-Batching for ML inference
+
+Requests that arrive within a short window are merged into ONE call of the
+wrapped batch function (one SentenceTransformer.encode for the whole batch).
+Every caller still awaits its own result.
+
+A batch is dispatched as soon as either:
+  - max_batch_size items are waiting, or
+  - max_wait_ms has passed since the first item of the batch arrived.
+
+The batch function is blocking (torch), so it runs in an executor and never
+stalls the asyncio event loop. Up to max_concurrent_batches batches run at
+once (one per inference worker), so the next batch fills while earlier ones
+are still encoding. If a batch call fails, its items are retried one by one,
+so one bad input only fails its own request.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Deque, List, Optional, Set, Tuple
+
+from workers import OverloadedError
+
+
+class MicroBatcher:
+    """
+    Collects single inference requests and runs them as one batch.
+
+    Usage:
+        batcher = MicroBatcher("evaluate", evaluator.evaluate_batch, 32, 5)
+        await batcher.start()
+        score, is_correct = await batcher.submit((user_answer, expected_answer))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        executor: Optional[Executor] = None,
+        max_queue: Optional[int] = None,
+        on_batch: Optional[Callable[[str, int, float], None]] = None,
+        max_concurrent_batches: Optional[int] = None,
+    ):
+        """
+        Args:
+            name: Label used in logs
+            batch_fn: Blocking function mapping a list of items to a list of
+                      results of the same length and order
+            max_batch_size: Upper bound on items merged into one call
+            max_wait_ms: How long the first item may wait for company
+            executor: Where batch_fn runs (default loop executor if None)
+            max_queue: Reject submits with OverloadedError beyond this many
+                       waiting items (None = unbounded)
+            on_batch: Called as on_batch(name, batch_size, seconds) after each
+                      successful batch (metrics)
+            max_concurrent_batches: Batches in flight at once (default: the
+                      executor's worker count, 1 for the loop's default executor)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.executor = executor
+        self.max_queue = max_queue
+        self.on_batch = on_batch
+        if max_concurrent_batches is None:
+            max_concurrent_batches = getattr(executor, "_max_workers", None) or 1
+        self.max_concurrent_batches = max(1, int(max_concurrent_batches))
+
+        self._pending: Deque[Tuple[Any, asyncio.Future]] = deque()
+        self._has_items: Optional[asyncio.Event] = None
+        self._batch_full: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+        # Stats
+        self.batches_run = 0
+        self.items_run = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of items waiting for the next batch"""
+        return len(self._pending)
+
+    async def start(self):
+        """Start the background dispatch loop (call from the running event loop)"""
+        if self._task is not None:
+            return
+        self._has_items = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+        self._task = asyncio.create_task(self._run(), name=f"batcher-{self.name}")
+
+    async def stop(self):
+        """Stop the dispatch loop and fail anything still waiting"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Batches already handed to the executor finish normally
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        while self._pending:
+            _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(RuntimeError(f"{self.name} batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its own result"""
+        if self._task is None:
+            raise RuntimeError(f"{self.name} batcher is not running")
+        if self.max_queue is not None and len(self._pending) >= self.max_queue:
+            raise OverloadedError(f"{self.name} batch queue full ({len(self._pending)} waiting)")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        self._has_items.set()
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self):
+        while True:
+            await self._has_items.wait()
+
+            # Give other requests a short window to join this batch
+            if len(self._pending) < self.max_batch_size and self.max_wait > 0:
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            # Wait for a free worker; items arriving meanwhile join this batch
+            await self._slots.acquire()
+            size = min(len(self._pending), self.max_batch_size)
+            batch = [self._pending.popleft() for _ in range(size)]
+            if not self._pending:
+                self._has_items.clear()
+
+            # Skip callers that already went away (client disconnect)
+            batch = [(item, future) for item, future in batch if not future.cancelled()]
+            if not batch:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(self._dispatch(batch), name=f"batch-{self.name}")
+            self._in_flight.add(task)
+            task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: asyncio.Task):
+        self._in_flight.discard(task)
+        self._slots.release()
+
+    def _run_items(self, items: List[Any]) -> List[Tuple[Any, Optional[BaseException]]]:
+        """Fallback after a failed batch: one call per item, errors kept per item"""
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append((self.batch_fn([item])[0], None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        loop = asyncio.get_running_loop()
+        items = [item for item, _ in batch]
+
+        start = time.perf_counter()
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"{self.name} batch returned {len(results)} results for {len(items)} items"
+                )
+        except OverloadedError as e:
+            # Saturated, not a bad input: retrying would only add load
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                outcomes = [(None, e)]
+            else:
+                try:
+                    outcomes = await loop.run_in_executor(self.executor, self._run_items, items)
+                except Exception as retry_error:
+                    outcomes = [(None, retry_error)] * len(batch)
+            for (_, future), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            return
+
+        self.batches_run += 1
+        self.items_run += len(items)
+        if self.on_batch is not None:
+            self.on_batch(self.name, len(items), time.perf_counter() - start)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,304 @@
+"""
+ML Service Load Test
+
+Drives /evaluate, /predict-intent and /predict at one or more concurrency levels
+and reports p50/p95/p99 latency, throughput and RSS per endpoint.
+
+Runs fully offline:
+  - the app is served in-process through httpx's ASGI transport (no sockets),
+    or against a running server with --url
+  - --stub swaps both models for deterministic stand-ins (no torch, no weights)
+    so the serving stack (batching, pool, limits, serialization) can be
+    benchmarked in CI; --stub-latency-ms simulates model time per batch
+  - request texts come from backend/ml/data/interview_intents.json, paired with
+    expected answers of the same topic from the question bank
+
+Results can be written as JSON (--output) to compare runs over time.
+
+Requires httpx (pip install httpx).
+
+Usage (from ml-service/):
+    python benchmarks/load_test.py --stub --concurrency 1,8,32 --requests 500
+    python benchmarks/load_test.py --concurrency 16 --output results/baseline.json
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+ML_SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(ML_SERVICE_DIR)
+BACKEND_DIR = os.path.join(REPO_DIR, "backend")
+sys.path.insert(0, ML_SERVICE_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+from workers import process_memory
+
+# ==================== CONFIG ====================
+CORPUS_PATH = os.path.join(BACKEND_DIR, "ml", "data", "interview_intents.json")
+ENDPOINTS = ("evaluate", "predict-intent", "predict")
+DEFAULT_SEED = 1234
+
+
+# ==================== CORPUS ====================
+def load_corpus(seed: int = DEFAULT_SEED) -> List[Dict[str, str]]:
+    """
+    Interview-style texts with a matching reference answer:
+    [{"text": ..., "expected_answer": ..., "topic": ...}, ...] in a seeded random order
+    """
+    from core.question_bank import QUESTION_REPO
+
+    with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+        samples = json.load(f)
+
+    rng = random.Random(seed)
+    all_answers = [ans for questions in QUESTION_REPO.values() for _, ans in questions]
+    corpus = []
+    for sample in samples:
+        topic = sample["label"][0] if sample["label"] else None
+        answers = [ans for _, ans in QUESTION_REPO.get(topic, [])] or all_answers
+        corpus.append({"text": sample["text"], "expected_answer": rng.choice(answers), "topic": topic})
+    rng.shuffle(corpus)
+    return corpus
+
+
+def build_request(endpoint: str, sample: Dict[str, str]) -> Tuple[str, dict]:
+    if endpoint == "evaluate":
+        return "/evaluate", {"user_answer": sample["text"], "expected_answer": sample["expected_answer"]}
+    return f"/{endpoint}", {"text": sample["text"], "threshold": 0.5}
+
+
+# ==================== STUB MODELS ====================
+class StubIntentPredictor:
+    """Deterministic stand-in for IntentPredictor (same batch API, no torch)"""
+
+    label_names = ["Java", "Python", "JavaScript", "React", "SQL", "Machine_Learning", "Deep_Learning"]
+    device = "cpu"
+    inference_mode = "stub"
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+
+    def predict_all_batch(self, items, k: int = 3):
+        if self.latency:
+            time.sleep(self.latency)
+        results = []
+        for text, threshold in items:
+            seed = sum(map(ord, text))
+            scores = {label: ((seed * (i + 7)) % 100) / 100 for i, label in enumerate(self.label_names)}
+            ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+            results.append({
+                "topics": [label for label, score in ranked if score >= threshold],
+                "predictions": ranked,
+                "scores": scores,
+                "top_k": ranked[:k],
+            })
+        return results
+
+
+class StubAnswerEvaluator:
+    """Deterministic stand-in for AnswerEvaluator (word overlap, no embeddings)"""
+
+    answer_index = None
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+
+    def evaluate_batch(self, pairs):
+        if self.latency:
+            time.sleep(self.latency)
+        results = []
+        for user_answer, expected_answer in pairs:
+            user_words = set(user_answer.lower().split())
+            expected_words = set(expected_answer.lower().split())
+            score = int(100 * len(user_words & expected_words) / max(1, len(expected_words)))
+            results.append((score, score >= 60))
+        return results
+
+
+def install_stubs(main_module, latency_ms: float):
+    """Pretend the models are loaded so lifespan only starts pool + batchers"""
+    main_module.intent_predictor = StubIntentPredictor(latency_ms)
+    main_module.answer_evaluator = StubAnswerEvaluator(latency_ms)
+    main_module.models_preloaded = True
+    main_module.startup.mark("loaded")
+
+
+# ==================== LOAD GENERATION ====================
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    corpus: List[Dict[str, str]],
+    concurrency: int,
+    total_requests: int,
+    warmup: int,
+) -> Dict[str, object]:
+    """Send `total_requests` to one endpoint from `concurrency` concurrent clients"""
+    for i in range(warmup):
+        path, body = build_request(endpoint, corpus[i % len(corpus)])
+        await client.post(path, json=body)
+
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    next_index = 0
+
+    async def worker():
+        nonlocal next_index
+        while next_index < total_requests:
+            i = next_index
+            next_index += 1
+            path, body = build_request(endpoint, corpus[i % len(corpus)])
+            start = time.perf_counter()
+            try:
+                response = await client.post(path, json=body)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    ok = statuses.get("200", 0)
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "ok": ok,
+        "errors": len(latencies) - ok,
+        "status_counts": statuses,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+        "latency_ms": {
+            "mean": round(statistics.mean(ordered) * 1000, 3) if ordered else None,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else None,
+        },
+    }
+
+
+async def server_memory(client: httpx.AsyncClient, in_process: bool) -> Optional[Dict[str, object]]:
+    """RSS/PSS of the process serving the requests"""
+    if in_process:
+        return process_memory()
+    try:
+        response = await client.get("/model-info")
+        return response.json().get("process")
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+async def run_benchmark(args) -> Dict[str, object]:
+    corpus = load_corpus(args.seed)
+    endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    results = []
+
+    async def drive(client: httpx.AsyncClient, in_process: bool):
+        for endpoint in endpoints:
+            for concurrency in levels:
+                result = await run_level(client, endpoint, corpus, concurrency, args.requests, args.warmup)
+                result["memory"] = await server_memory(client, in_process)
+                results.append(result)
+                latency = result["latency_ms"]
+                print(f"[BENCH] {endpoint:<15} c={concurrency:<4} {result['throughput_rps']:>9} req/s  "
+                      f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms  "
+                      f"errors={result['errors']}")
+
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits) as client:
+            await drive(client, in_process=False)
+        service = {"url": args.url}
+    else:
+        import main
+        if args.stub:
+            install_stubs(main, args.stub_latency_ms)
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=timeout) as client:
+                await drive(client, in_process=True)
+        service = {
+            "batching": main.config.BATCHING_ENABLED,
+            "batch_max_size": main.config.BATCH_MAX_SIZE,
+            "batch_max_wait_ms": main.config.BATCH_MAX_WAIT_MS,
+            "inference_workers": main.config.INFERENCE_WORKERS,
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "mode": "url" if args.url else ("stub" if args.stub else "in-process"),
+            "stub_latency_ms": args.stub_latency_ms if args.stub else None,
+            "requests_per_level": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "corpus_size": len(corpus),
+            "service": service,
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the ML service endpoints")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="Comma-separated endpoint names")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=300, help="Requests per endpoint and level")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests before each level")
+    parser.add_argument("--stub", action="store_true", help="Use stub models (no torch, for CI)")
+    parser.add_argument("--stub-latency-ms", type=float, default=2.0, help="Simulated model time per batch")
+    parser.add_argument("--url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout (s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Wrote {args.output}")
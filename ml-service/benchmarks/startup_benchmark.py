@@ -0,0 +1,126 @@
+"""
+ML Service Startup Benchmark
+
+Starts the service cold in fresh interpreters (no warm import caches in the
+process) and prints a per-phase breakdown of the time to ready:
+
+  interpreter       python start-up until the child's first line
+  import_main       main.py imports (FastAPI only, torch deferred)
+  inference_pool    worker pool creation (first torch import)
+  import_backend    IntentPredictor / AnswerEvaluator modules (sentence_transformers)
+  load_*            model loads (the shared embedding model loads with the first one)
+  warm_up           first inference
+  total             spawn -> warmed
+
+Usage (from ml-service/):
+    python benchmarks/startup_benchmark.py --runs 3
+    python benchmarks/startup_benchmark.py --runs 5 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ML_SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MARKER = "@@STARTUP_REPORT@@"
+
+# Runs inside the child: the real lifespan (eager mode), then dump the tracker
+CHILD_SCRIPT = f"""
+import time
+child_start = time.time()
+import asyncio, json, sys
+sys.path.insert(0, {ML_SERVICE_DIR!r})
+import main
+
+async def _start():
+    async with main.lifespan(main.app):
+        pass
+
+asyncio.run(_start())
+report = main.startup.report()
+report["child_start"] = child_start
+report["child_ready"] = time.time()
+print({MARKER!r} + json.dumps(report), flush=True)
+"""
+
+PHASE_ORDER = [
+    "interpreter", "import_main", "inference_pool", "import_backend",
+    "load_intent_predictor", "load_answer_evaluator", "warm_up", "total",
+]
+
+
+def run_once() -> Dict[str, float]:
+    """One cold start in a fresh interpreter; returns seconds per phase"""
+    env = dict(os.environ, STARTUP_MODE="eager")
+    # Wall clock (not perf_counter) so child timestamps are comparable;
+    # interpreter shutdown after the report is not counted
+    spawned = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        env=env, capture_output=True, text=True
+    )
+
+    line = next((l for l in proc.stdout.splitlines() if l.startswith(MARKER)), None)
+    if proc.returncode != 0 or line is None:
+        raise RuntimeError(f"Startup run failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+    report = json.loads(line[len(MARKER):])
+    if report["stages"]["warmed"] is None:
+        raise RuntimeError(f"Service never reached 'warmed': {report}")
+
+    phases = {
+        "interpreter": report["child_start"] - spawned,
+        "import_main": report["stages"]["imported"],
+        **report["phases"],
+        "total": report["child_ready"] - spawned,
+    }
+    return phases
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    names = [p for p in PHASE_ORDER if any(p in r for r in runs)]
+    names += sorted({p for r in runs for p in r} - set(names))
+    summary = {}
+    for name in names:
+        values = [r[name] for r in runs if name in r]
+        summary[name] = {
+            "mean": round(statistics.mean(values), 3),
+            "min": round(min(values), 3),
+            "max": round(max(values), 3),
+        }
+    return summary
+
+
+def print_table(summary: Dict[str, Dict[str, float]]):
+    total = summary["total"]["mean"] or 1.0
+    print(f"\n{'Phase':<24}{'mean (s)':>10}{'min':>10}{'max':>10}{'share':>8}")
+    print("-" * 62)
+    for name, stats in summary.items():
+        share = "" if name == "total" else f"{stats['mean'] / total * 100:.0f}%"
+        print(f"{name:<24}{stats['mean']:>10.3f}{stats['min']:>10.3f}{stats['max']:>10.3f}{share:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start time breakdown of the ML service")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", help="Also write per-run phases and the summary to this file")
+    args = parser.parse_args()
+
+    runs = []
+    for i in range(args.runs):
+        phases = run_once()
+        runs.append(phases)
+        print(f"[BENCH] Run {i + 1}/{args.runs}: ready in {phases['total']:.2f}s")
+
+    summary = summarize(runs)
+    print_table(summary)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": runs, "summary": summary}, f, indent=2)
+        print(f"\n[BENCH] Wrote {args.json}")
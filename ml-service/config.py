@@ -29,5 +29,34 @@ class Config:
     
     # Embedding model (same as used in original code)
     EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'all-MiniLM-L6-v2')
+    
+    # Micro-batching: concurrent requests are merged into one encode call
+    BATCHING_ENABLED = os.getenv('BATCHING_ENABLED', 'true').lower() == 'true'
+    BATCH_MAX_SIZE = int(os.getenv('BATCH_MAX_SIZE', 32))
+    BATCH_MAX_WAIT_MS = float(os.getenv('BATCH_MAX_WAIT_MS', 5))
+    BATCH_MAX_QUEUE = int(os.getenv('BATCH_MAX_QUEUE', 256))
+    
+    # Inference worker pool (model calls never run on the event loop)
+    INFERENCE_WORKERS = int(os.getenv('INFERENCE_WORKERS', 2))
+    INFERENCE_MAX_QUEUE = int(os.getenv('INFERENCE_MAX_QUEUE', 64))
+    # torch intra-op threads (0 = cores / INFERENCE_WORKERS)
+    TORCH_THREADS = int(os.getenv('TORCH_THREADS', 0))
+    
+    # Startup: "eager" loads + warms the models before serving,
+    # "background" serves immediately (503 until loaded) and loads in a thread
+    STARTUP_MODE = os.getenv('STARTUP_MODE', 'eager').lower()
+    
+    # Pre-fork serving (serve.py): processes forked after the models are loaded
+    SERVE_WORKERS = int(os.getenv('SERVE_WORKERS', 2))
+    
+    # Per-endpoint in-flight request caps, e.g. "evaluate=64,predict-batch=4"
+    ENDPOINT_CONCURRENCY = int(os.getenv('ENDPOINT_CONCURRENCY', 128))
+    ENDPOINT_LIMITS = os.getenv('ENDPOINT_LIMITS', 'evaluate-batch=8,predict-batch=8')
+    
+    # Prometheus metrics on /metrics (needs prometheus_client)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+    
+    # Bulk endpoints (/evaluate-batch, /predict-batch): max items per request
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 256))
 
 config = Config()
@@ -7,62 +7,252 @@ It does NOT reimplement the deep learning logic - it uses the existing:
   - backend/ml/models/intent_classifier.py (IntentClassifier)
   - backend/ml/training/intent_predictor.py (IntentPredictor)
   - backend/core/answer_evaluator.py (AnswerEvaluator)
+
+Heavy imports (torch, sentence_transformers) are deferred to model loading, so
+importing this module is fast. With STARTUP_MODE=background the server accepts
+requests right away and loads + warms the models in the background
+(/health reports the stage, /ready turns 200 once the models are loaded).
 """
 
+from startup import StartupTracker
+
+# Started first so the "imported" stage includes this module's own imports
+startup = StartupTracker()
+
+import asyncio
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel, Field
 
 # Add the backend directory to Python path to import original modules
 BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
 sys.path.insert(0, BACKEND_DIR)
 
-# Import the ORIGINAL implementations
-from ml.training.intent_predictor import IntentPredictor
-from core.answer_evaluator import AnswerEvaluator
+# The ORIGINAL implementations are imported in load_models() (they pull in torch)
+if TYPE_CHECKING:
+    from ml.training.intent_predictor import IntentPredictor
+    from core.answer_evaluator import AnswerEvaluator
 
 from config import config
+from batching import MicroBatcher
+from metrics import Metrics, MetricsMiddleware
+from workers import (
+    EndpointLimiter, InferencePool, OverloadedError, default_torch_threads, parse_limits,
+    process_memory
+)
+
+
+# Latency histograms, batch sizes, queue depth (no-ops when METRICS_ENABLED=false)
+metrics = Metrics(config.METRICS_ENABLED)
+if metrics.enabled:
+    # Per-stage timings from the backend (tokenize / encode / similarity / classify)
+    from utils.stage_timing import set_stage_observer
+    set_stage_observer(metrics.observe_stage)
 
 
 # Global instances of the ORIGINAL classes
-intent_predictor: Optional[IntentPredictor] = None
-answer_evaluator: Optional[AnswerEvaluator] = None
+intent_predictor: Optional["IntentPredictor"] = None
+answer_evaluator: Optional["AnswerEvaluator"] = None
+models_preloaded = False
+startup_task: Optional[asyncio.Task] = None
+
+# Micro-batchers (merge concurrent requests into one encode call)
+evaluate_batcher: Optional[MicroBatcher] = None
+intent_batcher: Optional[MicroBatcher] = None
+
+# Dedicated inference threads + per-endpoint in-flight caps (429 when saturated)
+inference_pool: Optional[InferencePool] = None
+endpoint_limiter = EndpointLimiter(parse_limits(config.ENDPOINT_LIMITS), config.ENDPOINT_CONCURRENCY)
+
+
+def _make_batcher(name, batch_fn) -> MicroBatcher:
+    """Build a batcher from config (batch size 1 when batching is disabled)"""
+    on_batch = metrics.observe_batch if metrics.enabled else None
+    if config.BATCHING_ENABLED:
+        return MicroBatcher(
+            name, batch_fn, config.BATCH_MAX_SIZE, config.BATCH_MAX_WAIT_MS,
+            executor=inference_pool, max_queue=config.BATCH_MAX_QUEUE, on_batch=on_batch,
+            max_concurrent_batches=config.INFERENCE_WORKERS
+        )
+    return MicroBatcher(
+        name, batch_fn, max_batch_size=1, max_wait_ms=0,
+        executor=inference_pool, max_queue=config.BATCH_MAX_QUEUE, on_batch=on_batch,
+        max_concurrent_batches=config.INFERENCE_WORKERS
+    )
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Load models on startup using the ORIGINAL Python classes"""
-    global intent_predictor, answer_evaluator
+def _run_bulk(batch_fn: Callable[[List[Any]], List[Any]], items: List[Any]) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Run a whole bulk request as ONE batch call.
+    If the batch fails, retry item by item so errors are reported per item.
+    Returns: list of (result, error_message) in input order
+    """
+    if not items:
+        return []
+    try:
+        return [(result, None) for result in batch_fn(items)]
+    except Exception:
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append((batch_fn([item])[0], None))
+            except Exception as e:
+                outcomes.append((None, str(e)))
+        return outcomes
+
+
+def _shared_engine():
+    """The embedding engine behind both models (None until one of them is loaded)"""
+    if answer_evaluator is not None:
+        return answer_evaluator.engine
+    if intent_predictor is not None:
+        return intent_predictor.embedding_engine
+    return None
+
+
+def _check_bulk_size(count: int):
+    if count > config.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many items: {count} (max {config.BULK_MAX_ITEMS})"
+        )
+
+
+def preload_models(warm_up: bool = True):
+    """
+    Load both models into the module globals (and warm them up).
+    Called by lifespan, or ONCE in the parent by serve.py before forking workers
+    (models that are already loaded are skipped).
+    """
+    global intent_predictor, answer_evaluator, models_preloaded
     
-    print("🔄 Loading ML models using ORIGINAL Python implementations...")
-    print(f"   Backend directory: {BACKEND_DIR}")
+    if not models_preloaded:
+        print("🔄 Loading ML models using ORIGINAL Python implementations...")
+        print(f"   Backend directory: {BACKEND_DIR}")
+        
+        with startup.phase("import_backend"):
+            from ml.training.intent_predictor import IntentPredictor
+            from core.answer_evaluator import AnswerEvaluator
+        
+        # Load Intent Predictor (uses original IntentClassifier + SentenceTransformer)
+        try:
+            with startup.phase("load_intent_predictor"):
+                intent_predictor = IntentPredictor()
+            print("✅ Loaded IntentPredictor (original implementation)")
+        except Exception as e:
+            print(f"⚠️ Could not load IntentPredictor: {e}")
+            intent_predictor = None
+        
+        # Load Answer Evaluator (original SentenceTransformer-based evaluation)
+        try:
+            with startup.phase("load_answer_evaluator"):
+                answer_evaluator = AnswerEvaluator()
+            print("✅ Loaded AnswerEvaluator (original implementation)")
+        except Exception as e:
+            print(f"⚠️ Could not load AnswerEvaluator: {e}")
+            answer_evaluator = None
+        
+        models_preloaded = True
+        startup.mark("loaded")
     
-    # Load Intent Predictor (uses original IntentClassifier + SentenceTransformer)
+    if warm_up:
+        warm_up_models()
+
+
+def warm_up_models():
+    """One tiny inference per model so the first real request pays no lazy initialization"""
+    if startup.reached("warmed"):
+        return
     try:
-        intent_predictor = IntentPredictor()
-        print("✅ Loaded IntentPredictor (original implementation)")
+        with startup.phase("warm_up"):
+            if answer_evaluator is not None:
+                answer_evaluator.evaluate_batch([("warm up answer", "warm up reference answer")])
+            if intent_predictor is not None:
+                intent_predictor.predict_all_batch([("warm up text", 0.5)])
     except Exception as e:
-        print(f"⚠️ Could not load IntentPredictor: {e}")
-        intent_predictor = None
+        print(f"⚠️ Warm-up failed: {e}")
+        return
+    startup.mark("warmed")
+
+
+async def _start_batchers():
+    """Start micro-batchers for the loaded models"""
+    global evaluate_batcher, intent_batcher
     
-    # Load Answer Evaluator (original SentenceTransformer-based evaluation)
+    if intent_predictor is not None:
+        batcher = _make_batcher("predict-intent", intent_predictor.predict_all_batch)
+        await batcher.start()
+        metrics.track_queue(batcher.name, lambda b=batcher: b.queue_depth)
+        intent_batcher = batcher
+    if answer_evaluator is not None:
+        batcher = _make_batcher("evaluate", answer_evaluator.evaluate_batch)
+        await batcher.start()
+        metrics.track_queue(batcher.name, lambda b=batcher: b.queue_depth)
+        evaluate_batcher = batcher
+    print(f"✅ Micro-batching {'enabled' if config.BATCHING_ENABLED else 'disabled'} "
+          f"(max_batch={config.BATCH_MAX_SIZE}, max_wait={config.BATCH_MAX_WAIT_MS}ms)")
+
+
+async def _background_startup():
+    """STARTUP_MODE=background: load, serve, then warm up, without blocking the event loop"""
+    loop = asyncio.get_running_loop()
     try:
-        answer_evaluator = AnswerEvaluator()
-        print("✅ Loaded AnswerEvaluator (original implementation)")
+        await loop.run_in_executor(None, preload_models, False)
+        await _start_batchers()
+        print("🚀 ML Service ready! (warming up in background)")
+        await loop.run_in_executor(None, warm_up_models)
     except Exception as e:
-        print(f"⚠️ Could not load AnswerEvaluator: {e}")
-        answer_evaluator = None
+        startup.error = str(e)
+        print(f"❌ Background startup failed: {e}")
+
+
+def _unavailable(name: str) -> HTTPException:
+    """503 for a model that failed to load or is still loading"""
+    if not startup.reached("loaded"):
+        return HTTPException(status_code=503, detail=f"{name} still loading")
+    return HTTPException(status_code=503, detail=f"{name} not available")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load models on startup using the ORIGINAL Python classes"""
+    global inference_pool, startup_task
+    
+    # Sized before model load so torch picks up the intra-op thread count
+    with startup.phase("inference_pool"):
+        inference_pool = InferencePool(
+            config.INFERENCE_WORKERS,
+            config.INFERENCE_MAX_QUEUE,
+            config.TORCH_THREADS or default_torch_threads(config.INFERENCE_WORKERS)
+        )
+    metrics.track_queue("inference-pool", lambda: inference_pool.pending)
+    print(f"✅ Inference pool: {inference_pool.stats()}")
     
-    print("🚀 ML Service ready!")
+    if config.STARTUP_MODE == "background" and not models_preloaded:
+        startup_task = asyncio.create_task(_background_startup())
+        print("🚀 ML Service accepting requests (models loading in background)")
+    else:
+        # No-op in pre-forked workers (serve.py): weights are shared copy-on-write
+        preload_models()
+        await _start_batchers()
+        print("🚀 ML Service ready!")
     
     yield
     
     # Cleanup
+    if startup_task is not None and not startup_task.done():
+        startup_task.cancel()
+    for batcher in (intent_batcher, evaluate_batcher):
+        if batcher is not None:
+            await batcher.stop()
+    inference_pool.shutdown(wait=False, cancel_futures=True)
     print("👋 ML Service shutting down")
 
 
@@ -115,6 +305,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if metrics.enabled:
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+
+@app.exception_handler(OverloadedError)
+async def overloaded_handler(request: Request, exc: OverloadedError):
+    """Saturated worker pool / batch queue / endpoint limit -> 429"""
+    return JSONResponse(status_code=429, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
 
 # ==================== Request/Response Models ====================
 
@@ -145,10 +344,74 @@ class PredictWithScoresResponse(BaseModel):
     top_topics: List[str]
 
 
+class EvaluateBatchRequest(BaseModel):
+    items: List[EvaluateRequest] = Field(..., description="Answer pairs to score in one pass")
+
+
+class EvaluateBatchItem(BaseModel):
+    index: int
+    score: Optional[int] = None
+    is_correct: Optional[bool] = None
+    error: Optional[str] = None
+
+
+class EvaluateBatchResponse(BaseModel):
+    results: List[EvaluateBatchItem]
+
+
+class EvaluateMultiRequest(BaseModel):
+    user_answer: str = Field(..., description="Candidate answer text")
+    references: List[str] = Field(
+        ..., min_length=1,
+        description=(
+            "Alternative reference ANSWERS (full answer text, e.g. several acceptable phrasings). "
+            "Do not pass bare keywords or follow-up questions: the best match wins, so a "
+            "one-word answer would match a keyword reference almost exactly. "
+            "The interview controller no longer uses this path (it scores against the expected answer only)."
+        )
+    )
+
+
+class ReferenceScore(BaseModel):
+    reference: str
+    score: int
+    similarity: float
+
+
+class EvaluateMultiResponse(BaseModel):
+    score: int
+    is_correct: bool
+    max: int
+    mean: float
+    best_reference: Optional[int] = None
+    breakdown: List[ReferenceScore]
+
+
+class IntentBatchRequest(BaseModel):
+    texts: List[str] = Field(..., description="Texts to classify in one pass")
+    threshold: float = Field(default=0.5, description="Minimum confidence threshold")
+
+
+class IntentBatchItem(BaseModel):
+    index: int
+    topics: List[str] = Field(default_factory=list)
+    scores: dict = Field(default_factory=dict)
+    top_topics: List[str] = Field(default_factory=list)
+    error: Optional[str] = None
+
+
+class IntentBatchResponse(BaseModel):
+    results: List[IntentBatchItem]
+
+
 class HealthResponse(BaseModel):
     status: str
     intent_predictor: bool
     answer_evaluator: bool
+    stage: str = Field(..., description="Startup stage: imported, loaded or warmed")
+    stages: Dict[str, Optional[float]] = Field(
+        default_factory=dict, description="Seconds after import start each stage was reached"
+    )
 
 
 # ==================== Endpoints ====================
@@ -160,43 +423,94 @@ class HealthResponse(BaseModel):
     summary="Check ML service health",
 )
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (always 200 while the process is up; see /ready)"""
+    if startup.error is not None:
+        status = "error"
+    elif startup.reached("loaded"):
+        status = "ok"
+    else:
+        status = "starting"
     return HealthResponse(
-        status="ok",
-        intent_predictor=intent_predictor is not None,
-        answer_evaluator=answer_evaluator is not None
+        status=status,
+        intent_predictor=intent_batcher is not None,
+        answer_evaluator=evaluate_batcher is not None,
+        stage=startup.stage,
+        stages=startup.stages
     )
 
 
+@app.get(
+    "/ready",
+    tags=["System"],
+    summary="Readiness probe (503 until the models are loaded)",
+)
+async def readiness_check():
+    """Readiness probe for load balancers / autoscalers"""
+    report = startup.report()
+    if evaluate_batcher is None and intent_batcher is None:
+        return JSONResponse(status_code=503, content=report)
+    return report
+
+
 @app.post(
     "/evaluate",
     response_model=EvaluateResponse,
     tags=["Answer Evaluation"],
     summary="Evaluate a candidate answer",
 )
+@metrics.instrument("evaluate")
 async def evaluate_answer(request: EvaluateRequest):
     """
     Evaluate user answer against expected answer.
     Uses the ORIGINAL AnswerEvaluator from backend/core/answer_evaluator.py
     """
-    if answer_evaluator is None:
-        raise HTTPException(
-            status_code=503, 
-            detail="AnswerEvaluator not available"
-        )
+    if evaluate_batcher is None:
+        raise _unavailable("AnswerEvaluator")
     
     try:
-        # Call the ORIGINAL evaluate method
-        score, is_correct = answer_evaluator.evaluate(
-            request.user_answer, 
-            request.expected_answer
-        )
+        # ORIGINAL evaluate logic, batched with concurrent requests
+        with endpoint_limiter.slot("evaluate"):
+            score, is_correct = await evaluate_batcher.submit(
+                (request.user_answer, request.expected_answer)
+            )
         
         return EvaluateResponse(
             score=score,
             is_correct=is_correct
         )
     
+    except OverloadedError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Evaluation error: {str(e)}")
+
+
+@app.post(
+    "/evaluate-multi",
+    response_model=EvaluateMultiResponse,
+    tags=["Answer Evaluation"],
+    summary="Evaluate a candidate answer against several references",
+)
+@metrics.instrument("evaluate-multi")
+async def evaluate_multi(request: EvaluateMultiRequest):
+    """
+    Score one answer against N reference answers with one encode + one matrix
+    product (AnswerEvaluator.evaluate_multi): best, mean and per-reference scores.
+    References must be answer texts, not keywords (best match wins).
+    """
+    if answer_evaluator is None:
+        raise _unavailable("AnswerEvaluator")
+    _check_bulk_size(len(request.references))
+    
+    try:
+        with endpoint_limiter.slot("evaluate-multi"):
+            result = await asyncio.get_running_loop().run_in_executor(
+                inference_pool, answer_evaluator.evaluate_multi, request.user_answer, request.references
+            )
+        return EvaluateMultiResponse(**result)
+    
+    except OverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Evaluation error: {str(e)}")
 
@@ -207,33 +521,30 @@ async def evaluate_answer(request: EvaluateRequest):
     tags=["Intent Detection"],
     summary="Predict interview topics from text",
 )
+@metrics.instrument("predict-intent")
 async def predict_intent(request: IntentRequest):
     """
     Predict which topics the text relates to.
     Uses the ORIGINAL IntentPredictor from backend/ml/training/intent_predictor.py
+    (one embedding + forward pass per request via predict_all)
     """
-    if intent_predictor is None:
-        raise HTTPException(
-            status_code=503, 
-            detail="IntentPredictor not available"
-        )
+    if intent_batcher is None:
+        raise _unavailable("IntentPredictor")
     
     try:
-        # Use ORIGINAL predict method
-        topics = intent_predictor.predict(request.text, request.threshold)
-        
-        # Use ORIGINAL predict_proba method
-        scores = intent_predictor.predict_proba(request.text)
-        
-        # Get top 3 topics
-        top_topics = [t[0] for t in intent_predictor.get_top_k(request.text, k=3)]
+        # Single-pass predict_all (topics + scores + top 3 from one encode),
+        # batched with concurrent requests
+        with endpoint_limiter.slot("predict-intent"):
+            result = await intent_batcher.submit((request.text, request.threshold))
         
         return IntentResponse(
-            topics=topics,
-            scores=scores,
-            top_topics=top_topics
+            topics=result["topics"],
+            scores=result["scores"],
+            top_topics=[t[0] for t in result["top_k"]]
         )
     
+    except OverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
@@ -244,30 +555,120 @@ async def predict_intent(request: IntentRequest):
     tags=["Intent Detection"],
     summary="Return ranked topic predictions with scores",
 )
+@metrics.instrument("predict")
 async def predict_with_scores(request: IntentRequest):
     """
     Predict topics with confidence scores.
-    Uses the ORIGINAL IntentPredictor.predict_with_scores method
+    Uses the ORIGINAL IntentPredictor (single-pass predict_all, micro-batched)
     """
-    if intent_predictor is None:
-        raise HTTPException(
-            status_code=503, 
-            detail="IntentPredictor not available"
-        )
+    if intent_batcher is None:
+        raise _unavailable("IntentPredictor")
     
     try:
-        # Use ORIGINAL predict_with_scores method
-        predictions = intent_predictor.predict_with_scores(request.text, request.threshold)
+        # predict_with_scores result from the single-pass predict_all, batched
+        with endpoint_limiter.slot("predict"):
+            result = await intent_batcher.submit((request.text, request.threshold))
+        predictions = result["predictions"]
         
         return {
             "predictions": [{"topic": p[0], "score": p[1]} for p in predictions],
             "top_topics": [p[0] for p in predictions[:3]]
         }
     
+    except OverloadedError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(e)}")
 
 
+@app.post(
+    "/evaluate-batch",
+    response_model=EvaluateBatchResponse,
+    tags=["Answer Evaluation"],
+    summary="Evaluate many candidate answers in one pass",
+)
+@metrics.instrument("evaluate-batch")
+async def evaluate_batch(request: EvaluateBatchRequest):
+    """
+    Score a list of (user_answer, expected_answer) pairs.
+    All texts are encoded in one call and scored with one row-wise cosine op
+    (AnswerEvaluator.evaluate_batch). Results and errors come back in input order.
+    """
+    if answer_evaluator is None:
+        raise _unavailable("AnswerEvaluator")
+    _check_bulk_size(len(request.items))
+    
+    results = [EvaluateBatchItem(index=i) for i in range(len(request.items))]
+    
+    # Per-item validation: items without a reference answer cannot be scored
+    valid = []
+    for i, item in enumerate(request.items):
+        if not item.expected_answer.strip():
+            results[i].error = "expected_answer is empty"
+        else:
+            valid.append(i)
+    
+    pairs = [(request.items[i].user_answer, request.items[i].expected_answer) for i in valid]
+    with endpoint_limiter.slot("evaluate-batch"):
+        start = time.perf_counter()
+        outcomes = await asyncio.get_running_loop().run_in_executor(
+            inference_pool, _run_bulk, answer_evaluator.evaluate_batch, pairs
+        )
+        metrics.observe_batch("evaluate-batch", len(pairs), time.perf_counter() - start)
+    
+    for i, (result, error) in zip(valid, outcomes):
+        if error is not None:
+            results[i].error = f"Evaluation error: {error}"
+        else:
+            results[i].score, results[i].is_correct = result
+    
+    return EvaluateBatchResponse(results=results)
+
+
+@app.post(
+    "/predict-batch",
+    response_model=IntentBatchResponse,
+    tags=["Intent Detection"],
+    summary="Predict interview topics for many texts in one pass",
+)
+@metrics.instrument("predict-batch")
+async def predict_batch(request: IntentBatchRequest):
+    """
+    Classify a list of texts with one batched encode + forward pass
+    (IntentPredictor.predict_all_batch). Results and errors come back in input order.
+    """
+    if intent_predictor is None:
+        raise _unavailable("IntentPredictor")
+    _check_bulk_size(len(request.texts))
+    
+    results = [IntentBatchItem(index=i) for i in range(len(request.texts))]
+    
+    valid = []
+    for i, text in enumerate(request.texts):
+        if not text.strip():
+            results[i].error = "text is empty"
+        else:
+            valid.append(i)
+    
+    items = [(request.texts[i], request.threshold) for i in valid]
+    with endpoint_limiter.slot("predict-batch"):
+        start = time.perf_counter()
+        outcomes = await asyncio.get_running_loop().run_in_executor(
+            inference_pool, _run_bulk, intent_predictor.predict_all_batch, items
+        )
+        metrics.observe_batch("predict-batch", len(items), time.perf_counter() - start)
+    
+    for i, (result, error) in zip(valid, outcomes):
+        if error is not None:
+            results[i].error = f"Prediction error: {error}"
+        else:
+            results[i].topics = result["topics"]
+            results[i].scores = result["scores"]
+            results[i].top_topics = [t[0] for t in result["top_k"]]
+    
+    return IntentBatchResponse(results=results)
+
+
 @app.get(
     "/model-info",
     tags=["Diagnostics"],
@@ -277,25 +678,75 @@ async def model_info():
     """Get information about the loaded models"""
     info = {
         "intent_predictor": None,
-        "answer_evaluator": None
+        "answer_evaluator": None,
+        "embedding_engine": None,
+        "inference_pool": inference_pool.stats() if inference_pool is not None else None,
+        "endpoint_limits": endpoint_limiter.stats(),
+        "process": process_memory(),
+        "startup": startup.report(),
+        "batchers": {
+            b.name: {"queue_depth": b.queue_depth, "batches_run": b.batches_run, "items_run": b.items_run}
+            for b in (evaluate_batcher, intent_batcher) if b is not None
+        }
     }
     
     if intent_predictor is not None:
         info["intent_predictor"] = {
             "labels": intent_predictor.label_names,
             "device": str(intent_predictor.device),
+            "inference_mode": intent_predictor.inference_mode,
             "model_type": "IntentClassifier (MLP 384->128->64->7)"
         }
     
     if answer_evaluator is not None:
         info["answer_evaluator"] = {
             "model": "all-MiniLM-L6-v2",
-            "method": "Cosine Similarity"
+            "method": "Cosine Similarity",
+            "expected_answer_index": (
+                len(answer_evaluator.answer_index)
+                if answer_evaluator.answer_index is not None else None
+            )
         }
     
+    # Single shared SentenceTransformer behind both models
+    engine = _shared_engine()
+    if engine is not None:
+        info["embedding_engine"] = engine.info()
+    
     return info
 
 
+@app.get(
+    "/cache-stats",
+    tags=["Diagnostics"],
+    summary="Inspect embedding cache hit/miss/eviction counters",
+)
+async def cache_stats():
+    """Counters of the shared embedding cache (LRU + TTL)"""
+    engine = _shared_engine()
+    if engine is None:
+        raise HTTPException(status_code=503, detail="Embedding engine not available")
+    if engine.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **engine.cache.stats()}
+
+
+@app.get(
+    "/metrics",
+    tags=["Diagnostics"],
+    summary="Prometheus metrics (latency histograms, batch sizes, queue depth)",
+    response_class=PlainTextResponse,
+)
+async def prometheus_metrics():
+    """Prometheus text exposition of this worker's metrics"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics disabled")
+    return Response(metrics.render(startup, _shared_engine()), media_type=metrics.content_type)
+
+
+startup.mark("imported")
+
+
 # Run the server
 if __name__ == "__main__":
     import uvicorn
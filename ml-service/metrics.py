@@ -0,0 +1,181 @@
+"""
+Prometheus Metrics for the ML Service
+
+Recorded:
+  ml_request_duration_seconds{endpoint,method,status}   whole HTTP request
+  ml_handler_duration_seconds{endpoint}                 endpoint function only
+  ml_stage_duration_seconds{component,stage}            inference stages reported by the
+                                                        backend (utils.stage_timing): tokenize,
+                                                        encode, cache_lookup, index_lookup,
+                                                        similarity, classify, ... and
+                                                        http/parse_serialize (request - handler:
+                                                        validation + JSON serialization)
+  ml_batch_size{batcher} / ml_batch_duration_seconds    micro-batches and bulk requests
+  ml_queue_depth{queue}                                 batcher queues and inference pool backlog
+  ml_startup_phase_seconds{phase}                       model imports / loads / warm-up
+  ml_embedding_cache_{hits,misses,entries}              shared embedding cache
+
+Exposed on GET /metrics. With METRICS_ENABLED=false (or prometheus_client missing)
+no middleware or observer is installed and every recorder returns immediately.
+Each pre-forked worker (serve.py) keeps its own registry.
+"""
+
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+# Endpoint function time of the current request, read back by the middleware
+_handler_seconds: ContextVar[Optional[Dict[str, float]]] = ContextVar("handler_seconds", default=None)
+
+
+class Metrics:
+    """Holds the metric families; all recorders are no-ops when disabled"""
+
+    def __init__(self, enabled: bool):
+        if enabled and prometheus_client is None:
+            print("[METRICS] ⚠️ prometheus_client not installed, metrics disabled")
+        self.enabled = enabled and prometheus_client is not None
+        if not self.enabled:
+            return
+
+        from prometheus_client import CollectorRegistry, Gauge, Histogram
+
+        self.registry = CollectorRegistry()
+        self.request_latency = Histogram(
+            "ml_request_duration_seconds", "HTTP request latency",
+            ["endpoint", "method", "status"], buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.handler_latency = Histogram(
+            "ml_handler_duration_seconds", "Endpoint function latency",
+            ["endpoint"], buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.stage_latency = Histogram(
+            "ml_stage_duration_seconds", "Inference stage latency",
+            ["component", "stage"], buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.batch_size = Histogram(
+            "ml_batch_size", "Items per model call",
+            ["batcher"], buckets=BATCH_SIZE_BUCKETS, registry=self.registry
+        )
+        self.batch_latency = Histogram(
+            "ml_batch_duration_seconds", "Model call latency per batch",
+            ["batcher"], buckets=LATENCY_BUCKETS, registry=self.registry
+        )
+        self.queue_depth = Gauge(
+            "ml_queue_depth", "Items waiting", ["queue"], registry=self.registry
+        )
+        self.startup_phase = Gauge(
+            "ml_startup_phase_seconds", "Startup phase durations (model imports, loads, warm-up)",
+            ["phase"], registry=self.registry
+        )
+        self.cache_hits = Gauge("ml_embedding_cache_hits", "Embedding cache hits", registry=self.registry)
+        self.cache_misses = Gauge("ml_embedding_cache_misses", "Embedding cache misses", registry=self.registry)
+        self.cache_entries = Gauge("ml_embedding_cache_entries", "Embedding cache entries", registry=self.registry)
+
+        # labels() takes a lock; stage observations come from inference threads on every call
+        self._stage_children: Dict[tuple, object] = {}
+
+    # ==================== Recorders ====================
+
+    def observe_stage(self, component: str, stage: str, seconds: float):
+        """utils.stage_timing observer"""
+        child = self._stage_children.get((component, stage))
+        if child is None:
+            child = self._stage_children[(component, stage)] = self.stage_latency.labels(component, stage)
+        child.observe(seconds)
+
+    def observe_batch(self, name: str, size: int, seconds: float):
+        if self.enabled:
+            self.batch_size.labels(name).observe(size)
+            self.batch_latency.labels(name).observe(seconds)
+
+    def track_queue(self, name: str, depth_fn: Callable[[], int]):
+        """Queue depth read at scrape time"""
+        if self.enabled:
+            self.queue_depth.labels(name).set_function(depth_fn)
+
+    def instrument(self, endpoint: str):
+        """Decorator timing an async endpoint function (returned unchanged when disabled)"""
+        def decorator(fn):
+            if not self.enabled:
+                return fn
+            child = self.handler_latency.labels(endpoint)
+
+            @wraps(fn)
+            async def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    child.observe(elapsed)
+                    timing = _handler_seconds.get()
+                    if timing is not None:
+                        timing["handler"] = elapsed
+            return wrapper
+        return decorator
+
+    def render(self, startup=None, engine=None) -> bytes:
+        """Prometheus text format; refreshes startup and cache gauges first"""
+        if startup is not None:
+            for phase, seconds in startup.phases.items():
+                self.startup_phase.labels(phase).set(seconds)
+        if engine is not None and engine.cache is not None:
+            stats = engine.cache.stats()
+            self.cache_hits.set(stats["hits"])
+            self.cache_misses.set(stats["misses"])
+            self.cache_entries.set(stats["entries"])
+        return prometheus_client.generate_latest(self.registry)
+
+    @property
+    def content_type(self) -> str:
+        return prometheus_client.CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: request latency per route template and status,
+    plus the non-handler share of the request (validation + serialization).
+    """
+
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = [500]
+        timing: Dict[str, float] = {}
+        token = _handler_seconds.set(timing)
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _handler_seconds.reset(token)
+            elapsed = time.perf_counter() - start
+            # Route template, not the raw path (bounded label cardinality)
+            route = scope.get("route")
+            endpoint = getattr(route, "path", None) or "unmatched"
+            self.metrics.request_latency.labels(endpoint, scope["method"], str(status[0])).observe(elapsed)
+            if "handler" in timing:
+                self.metrics.observe_stage("http", "parse_serialize", max(0.0, elapsed - timing["handler"]))
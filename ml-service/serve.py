@@ -0,0 +1,146 @@
+"""
+Pre-fork ML Service Server
+
+`uvicorn main:app --workers N` starts N fresh interpreters and every one of them
+loads IntentPredictor and AnswerEvaluator again (N x load time, N x weights in RAM).
+
+This launcher loads the models ONCE in a parent process, then forks N workers
+that share the weights copy-on-write and accept on the same listening socket:
+  - startup cost is paid once, workers are ready right after fork
+  - model weights are read-only at inference time, so their pages stay shared
+  - a crashed worker is re-forked from the parent (no reload)
+
+Platforms without os.fork (Windows) fall back to a single uvicorn process.
+
+Usage (from ml-service/):
+    python serve.py --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import time
+from typing import Dict
+
+import uvicorn
+
+from config import config
+from workers import default_torch_threads
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """Listening socket created in the parent and inherited by every worker"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket):
+    """Child process: serve the already-loaded app on the shared socket"""
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    server.run(sockets=[sock])
+
+
+def _fork_worker(app, sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(app, sock)
+        except BaseException as e:
+            print(f"[SERVE] ❌ Worker {os.getpid()} crashed: {e}")
+            code = 1
+        finally:
+            os._exit(code)
+    print(f"[SERVE] Started worker {pid}")
+    return pid
+
+
+def serve(workers: int, host: str, port: int):
+    """Load models once, then fork `workers` processes sharing them"""
+    if not hasattr(os, "fork") or workers <= 1:
+        import main
+        if workers > 1:
+            print("[SERVE] ⚠️ os.fork not available on this platform, running a single worker")
+        uvicorn.run(main.app, host=host, port=port)
+        return
+
+    # Split the cores between processes and their inference threads
+    if not config.TORCH_THREADS:
+        config.TORCH_THREADS = default_torch_threads(workers * config.INFERENCE_WORKERS)
+
+    # The parent must not start torch's OpenMP pool: its threads do not survive
+    # fork and the children would hang on their first parallel op.
+    # Each worker sets its own thread count when its inference pool starts.
+    import torch
+    torch.set_num_threads(1)
+
+    import main
+    start = time.perf_counter()
+    main.preload_models()
+    print(f"[SERVE] Models loaded once in parent {os.getpid()} ({time.perf_counter() - start:.2f}s)")
+
+    sock = _bind_socket(host, port)
+
+    # Keep the GC from touching (and so copying) every pre-fork object in the children
+    gc.freeze()
+
+    children: Dict[int, float] = {}
+    for _ in range(workers):
+        children[_fork_worker(main.app, sock)] = time.monotonic()
+    print(f"[SERVE] 🚀 {workers} workers on http://{host}:{port} "
+          f"(torch threads per worker: {config.TORCH_THREADS})")
+
+    stopping = False
+
+    def _shutdown(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+
+        print(f"[SERVE] ⚠️ Worker {pid} exited (status {status}), re-forking")
+        # Back off if workers die right after start (e.g. port or model problem)
+        if time.monotonic() - started < 1.0:
+            time.sleep(1.0)
+        children[_fork_worker(main.app, sock)] = time.monotonic()
+
+    sock.close()
+    print("[SERVE] 👋 All workers stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-fork ML service (models loaded once, shared by workers)")
+    parser.add_argument("--workers", type=int, default=config.SERVE_WORKERS)
+    parser.add_argument("--host", default=config.HOST)
+    parser.add_argument("--port", type=int, default=config.PORT)
+    args = parser.parse_args()
+
+    serve(args.workers, args.host, args.port)
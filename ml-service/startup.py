@@ -0,0 +1,60 @@
+"""
+Startup Readiness Tracking
+
+The service comes up in stages:
+  imported -> main.py imported (FastAPI only, no torch yet)
+  loaded   -> IntentPredictor / AnswerEvaluator loaded, endpoints usable
+  warmed   -> one warm-up inference done (first real request pays no lazy init)
+
+Every stage and the phases inside it (backend imports, each model load, warm-up)
+are timed from the moment main.py starts importing. /health and the startup
+benchmark (benchmarks/startup_benchmark.py) read them from here.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+STAGES = ("imported", "loaded", "warmed")
+
+
+class StartupTracker:
+    """Records when each startup stage was reached and how long each phase took"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Optional[float]] = {stage: None for stage in STAGES}
+        self.phases: Dict[str, float] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def stage(self) -> str:
+        """Latest stage reached ("starting" before main.py finished importing)"""
+        reached = [stage for stage in STAGES if self.stages[stage] is not None]
+        return reached[-1] if reached else "starting"
+
+    def reached(self, stage: str) -> bool:
+        return self.stages[stage] is not None
+
+    def mark(self, stage: str):
+        """Record that `stage` was reached (first call wins)"""
+        if self.stages[stage] is None:
+            self.stages[stage] = round(time.perf_counter() - self.started, 3)
+            print(f"[STARTUP] {stage} after {self.stages[stage]:.2f}s")
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time one startup phase (e.g. 'load_intent_predictor')"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(time.perf_counter() - start, 3)
+
+    def report(self) -> Dict[str, object]:
+        return {
+            "stage": self.stage,
+            "stages": dict(self.stages),
+            "phases": dict(self.phases),
+            "error": self.error,
+        }
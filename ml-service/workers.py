@@ -0,0 +1,154 @@
+"""
+Inference Worker Pool + Backpressure
+
+All model calls run on a dedicated, sized thread pool instead of the asyncio
+event loop, so /health and request parsing stay responsive while encodes run.
+
+Backpressure:
+  - InferencePool rejects new jobs once `max_queue` jobs are pending
+  - EndpointLimiter caps in-flight requests per endpoint
+Both raise OverloadedError, which main.py maps to HTTP 429.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class OverloadedError(RuntimeError):
+    """Raised when the service is saturated and should answer 429"""
+
+
+class InferencePool(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor with a bounded backlog.
+    Works anywhere an Executor is expected (loop.run_in_executor, MicroBatcher).
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, torch_threads: Optional[int] = None):
+        """
+        Args:
+            max_workers: Concurrent inference jobs
+            max_queue: Max jobs pending (running + waiting) before rejecting
+            torch_threads: torch intra-op threads (process-wide); None leaves torch's default
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix="inference")
+        self.max_queue = max(1, int(max_queue))
+        self.torch_threads = torch_threads
+
+        if torch_threads:
+            try:
+                import torch
+                torch.set_num_threads(torch_threads)
+            except ImportError:
+                # Stub-model benchmarks run without torch
+                self.torch_threads = None
+
+        self._count_lock = threading.Lock()
+        self._pending = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._count_lock:
+            if self._pending >= self.max_queue:
+                self.rejected += 1
+                raise OverloadedError(f"Inference queue full ({self._pending}/{self.max_queue} jobs pending)")
+            self._pending += 1
+
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self):
+        with self._count_lock:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self._max_workers,
+            "torch_threads": self.torch_threads,
+            "pending": self._pending,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
+
+
+class EndpointLimiter:
+    """
+    Per-endpoint cap on in-flight requests (non-blocking: over the cap -> OverloadedError).
+    Used only from the event loop thread, so plain counters are enough.
+    """
+
+    def __init__(self, limits: Dict[str, int], default_limit: int):
+        self.limits = dict(limits)
+        self.default_limit = max(1, int(default_limit))
+        self._in_flight: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+
+    @contextmanager
+    def slot(self, endpoint: str):
+        limit = self.limits.get(endpoint, self.default_limit)
+        in_flight = self._in_flight.get(endpoint, 0)
+        if in_flight >= limit:
+            self._rejected[endpoint] = self._rejected.get(endpoint, 0) + 1
+            raise OverloadedError(f"Too many concurrent {endpoint} requests ({in_flight}/{limit})")
+
+        self._in_flight[endpoint] = in_flight + 1
+        try:
+            yield
+        finally:
+            self._in_flight[endpoint] -= 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        endpoints = set(self.limits) | set(self._in_flight)
+        return {
+            endpoint: {
+                "in_flight": self._in_flight.get(endpoint, 0),
+                "limit": self.limits.get(endpoint, self.default_limit),
+                "rejected": self._rejected.get(endpoint, 0),
+            }
+            for endpoint in sorted(endpoints)
+        }
+
+
+def parse_limits(spec: str) -> Dict[str, int]:
+    """'evaluate=64,predict-intent=32' -> {'evaluate': 64, 'predict-intent': 32}"""
+    limits = {}
+    for part in spec.split(","):
+        if "=" in part:
+            name, value = part.split("=", 1)
+            limits[name.strip()] = int(value)
+    return limits
+
+
+def default_torch_threads(workers: int) -> int:
+    """Split the cores between workers so they do not oversubscribe the CPU"""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def process_memory() -> Dict[str, object]:
+    """
+    RSS and PSS of this process in MB (Linux /proc; None elsewhere).
+    PSS splits shared pages between processes, so pre-forked workers that share
+    the model weights copy-on-write show a PSS well below their RSS.
+    """
+    memory = {"pid": os.getpid(), "rss_mb": None, "pss_mb": None}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    memory[f"{key.lower()}_mb"] = round(int(value.split()[0]) / 1024, 1)
+    except OSError:
+        pass
+    return memory
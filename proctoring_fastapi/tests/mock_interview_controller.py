@@ -22,8 +22,12 @@ class MockInterviewController(InterviewController):
         
         # Manually init what we need
         self.processing_queue = queue.Queue()
+        self.scoring_queue = queue.Queue()
+        self.transcribe_workers = 1  # The script is read in order
+        self.next_answer_seq = 0
         self.active_tasks = 0
         self.lock = import_threading_lock()
+        self.answer_scorer = None
         
         # Init Brains (Real logic, mocked IO)
         from backend.ml.training.intent_predictor import IntentPredictor
@@ -32,6 +36,11 @@ class MockInterviewController(InterviewController):
         self.judge = AnswerEvaluator()
         
         self.context_keywords = queue.Queue()
+        self.context_answers = queue.Queue()
+        self.question_index = None  # Keyword follow-ups only
+        self.last_context_seq = -1
+        self.planner = None
+        self.turn_ended_at = 0.0
         self.stop_signal = False
         self.skip_signal = False
         self.stop_phrases = ["stop interview", "terminate", "end session", "abort"]
@@ -42,13 +51,15 @@ class MockInterviewController(InterviewController):
         self.current_topic = ""
         self.questions_asked_count = 0
         self.asked_q_hashes = set()
+        from backend.core.question_bank import QuestionSampler
+        self.question_sampler = QuestionSampler()
         self.report_card = []
         self.is_running = False
         
-        # Start Worker
+        # Start Workers
         from concurrent.futures import ThreadPoolExecutor
         self.executor = ThreadPoolExecutor(max_workers=1)
-        self.executor.submit(self._background_processor)
+        self._start_background_workers()
         
     def _set_indian_voice(self):
         pass # No Audio
@@ -63,12 +74,14 @@ class MockInterviewController(InterviewController):
         time.sleep(1) # Simulate talking time
         return np.array([0], dtype=np.float32)
         
-    def _transcribe_internal(self, audio):
+    def _transcribe_internal(self, audio, on_segment=None):
         # Override to return next line from script
         if self.script_index < len(self.script):
             ans = self.script[self.script_index]
             self.script_index += 1
             print(f"👤 [MOCK CANDIDATE]: {ans}")
+            if on_segment is not None:
+                on_segment(ans)
             return ans
         else:
             print("👤 [MOCK CANDIDATE]: (Silence/No more script)")